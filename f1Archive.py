@@ -0,0 +1,226 @@
+import os
+import sys
+import json
+import shutil
+import argparse
+from datetime import datetime
+from functools import lru_cache
+
+# --- SEZON ARŞİVİ ---
+# Geçmiş sezonlar değişmez: her sezon bir kez indirilir (ya da kayıtlı fikstürlerden
+# üretilir) ve archive/season=YYYY/ altında tablo başına bir Parquet dosyası olarak saklanır.
+# Bir sezon yalnızca seçildiğinde, bellek eşlemeli (memory-mapped) olarak okunur.
+# pandas/pyarrow yalnızca arşiv gerçekten kullanıldığında içe aktarılır.
+ARCHIVE_DIR = os.environ.get("F1_ARCHIVE_DIR", "archive")
+FIRST_SEASON = 1950
+TABLES = ("drivers", "constructors", "results", "calendar")
+# Sezon başına kaydedilen Ergast uç noktaları: {fikstür adı: URL yolu}
+ENDPOINTS = {
+    "driverStandings": "{season}/driverStandings.json",
+    "constructorStandings": "{season}/constructorStandings.json",
+    "calendar": "{season}.json",
+    "results": "{season}/results.json",
+    "sprint": "{season}/sprint.json",
+    "qualifying": "{season}/qualifying.json"
+}
+SESSION_KEYS = ("FirstPractice", "SecondPractice", "ThirdPractice", "SprintQualifying", "Sprint", "Qualifying")
+
+def season_dir(season, archive_dir=ARCHIVE_DIR):
+    return os.path.join(archive_dir, f"season={int(season)}")
+
+def available_seasons(archive_dir=ARCHIVE_DIR):
+    if not os.path.isdir(archive_dir): return []
+    seasons = [int(d.split("=", 1)[1]) for d in os.listdir(archive_dir) if d.startswith("season=") and d.split("=", 1)[1].isdigit()]
+    return sorted(seasons, reverse=True)
+
+# --- KAYNAKLAR ---
+# Kaynak: (sezon, uç nokta) -> Ergast sayfa listesi ya da None
+def live_source(season, endpoint):
+    import f1Data
+    return f1Data.fetch_pages(f"{f1Data.API_BASE}/{ENDPOINTS[endpoint].format(season=season)}")
+
+def fixture_source(fixture_dir):
+    # Fikstür düzeni: <dizin>/<sezon>/<uç nokta>.json (tek sayfa ya da sayfa listesi)
+    def source(season, endpoint):
+        path = os.path.join(fixture_dir, str(season), f"{endpoint}.json")
+        if not os.path.exists(path): return None
+        with open(path, encoding="utf-8") as f:
+            pages = json.load(f)
+        return pages if isinstance(pages, list) else [pages]
+    return source
+
+# --- TABLOLAR ---
+def standings_rows(pages, list_key):
+    for page in pages or []:
+        for standings in page['MRData']['StandingsTable']['StandingsLists']:
+            yield from standings[list_key]
+
+def drivers_table(pages):
+    import pandas as pd
+    return pd.DataFrame([
+        {
+            "pos": s.get('position', s.get('positionText', "-")),
+            "name": f"{s['Driver']['givenName']} {s['Driver']['familyName'].upper()}",
+            "team": s['Constructors'][-1]['name'] if s.get('Constructors') else "",
+            "team_id": s['Constructors'][-1]['constructorId'] if s.get('Constructors') else "",
+            "points": s['points'], "wins": int(s['wins']),
+            "id": s['Driver']['driverId']
+        }
+        for s in standings_rows(pages, 'DriverStandings')
+    ], columns=["pos", "name", "team", "team_id", "points", "wins", "id"])
+
+def constructors_table(pages):
+    import pandas as pd
+    # 1958 öncesinde takımlar şampiyonası yoktur; tablo boş kalır
+    return pd.DataFrame([
+        {
+            "pos": c.get('position', c.get('positionText', "-")), "name": c['Constructor']['name'],
+            "points": c['points'], "wins": c['wins'], "id": c['Constructor']['constructorId']
+        }
+        for c in standings_rows(pages, 'ConstructorStandings')
+    ], columns=["pos", "name", "points", "wins", "id"])
+
+def results_table(pages_by_kind):
+    import pandas as pd
+    import f1Data
+    import f1Stats
+    frames = [f1Stats.results_frame(f1Data.merge_races(pages, kind), kind) for kind, pages in pages_by_kind.items() if pages]
+    if not frames: return pd.DataFrame(columns=f1Stats.RESULT_COLUMNS)
+    return pd.concat(frames, ignore_index=True)
+
+def calendar_table(pages):
+    import pandas as pd
+    rows = []
+    for page in pages or []:
+        for r in page['MRData']['RaceTable']['Races']:
+            row = {"round": r['round'], "raceName": r['raceName'], "circuitName": r['Circuit']['circuitName'],
+                   "date": r['date'], "time": r.get('time')}
+            for key in SESSION_KEYS:
+                row[f"{key}_date"] = r.get(key, {}).get('date')
+                row[f"{key}_time"] = r.get(key, {}).get('time')
+            rows.append(row)
+    columns = ["round", "raceName", "circuitName", "date", "time"] + [f"{k}_{f}" for k in SESSION_KEYS for f in ("date", "time")]
+    return pd.DataFrame(rows, columns=columns)
+
+def build_season(season, source, archive_dir=ARCHIVE_DIR):
+    """Sezonun tüm tablolarını kaynaktan üretip bölüme atomik olarak yazar."""
+    pages = {endpoint: source(season, endpoint) for endpoint in ENDPOINTS}
+    if not pages["calendar"] or not pages["driverStandings"]:
+        raise ValueError(f"{season} sezonu için takvim ya da sıralama verisi yok")
+    tables = {
+        "drivers": drivers_table(pages["driverStandings"]),
+        "constructors": constructors_table(pages["constructorStandings"]),
+        "results": results_table({kind: pages[kind] for kind in ("results", "sprint", "qualifying")}),
+        "calendar": calendar_table(pages["calendar"])
+    }
+    final_dir = season_dir(season, archive_dir)
+    tmp_dir = f"{final_dir}.tmp"
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    os.makedirs(tmp_dir)
+    for name, table in tables.items():
+        table.to_parquet(os.path.join(tmp_dir, f"{name}.parquet"), index=False)
+    shutil.rmtree(final_dir, ignore_errors=True)
+    os.replace(tmp_dir, final_dir)
+    return final_dir
+
+# --- OKUMA ---
+@lru_cache(maxsize=8)
+def load_season(season, archive_dir=ARCHIVE_DIR):
+    import pyarrow.parquet as pq
+    part = season_dir(season, archive_dir)
+    return {name: pq.read_table(os.path.join(part, f"{name}.parquet"), memory_map=True).to_pandas() for name in TABLES}
+
+def present(value):
+    import pandas as pd
+    # Parquet'ten dönen boş hücreler None ya da NaN olabilir
+    return value is not None and not pd.isna(value) and value != ""
+
+def race_dicts(calendar):
+    # Takvim tablosunu f1Data.build_calendar'ın beklediği Ergast biçimine geri çevirir
+    races = []
+    for row in calendar.to_dict("records"):
+        race = {"round": row['round'], "raceName": row['raceName'], "Circuit": {"circuitName": row['circuitName']}, "date": row['date']}
+        if present(row['time']): race['time'] = row['time']
+        for key in SESSION_KEYS:
+            if present(row[f"{key}_date"]):
+                race[key] = {"date": row[f"{key}_date"], "time": row[f"{key}_time"] if present(row[f"{key}_time"]) else None}
+        races.append(race)
+    return races
+
+@lru_cache(maxsize=8)
+def season_view(season, archive_dir=ARCHIVE_DIR):
+    """Arşivlenmiş sezonu get_all_data() ile aynı biçimde döner: (drivers, constructors, calendar)"""
+    import pandas as pd
+    import f1Data
+    import f1Stats
+    tables = load_season(season, archive_dir)
+    results = tables["results"]
+    stats = f1Stats.stats_from_frame(results) if len(results) else {key: pd.DataFrame() for key in f1Stats.ENTITY_KEYS}
+
+    drivers = [{**d, "podiums": 0, "dnf": 0, **f1Data.stat_values(stats["driverId"], d['id'])} for d in tables["drivers"].to_dict("records")]
+    constructors = [{**c, **f1Data.stat_values(stats["constructorId"], c['id'])} for c in tables["constructors"].to_dict("records")]
+
+    race = results[results['kind'] == "results"].sort_values(["round", "position"])
+    winners = {str(rnd): codes[:3] for rnd, codes in race.groupby("round")['code'].agg(list).items()}
+    quali = results[(results['kind'] == "qualifying") & (results['position'] == 1)]
+    poles = {str(rnd): code for rnd, code in zip(quali['round'], quali['code'])}
+    calendar = f1Data.build_calendar(race_dicts(tables["calendar"]), winners, poles)
+    return drivers, constructors, calendar
+
+# --- KOMUT SATIRI ---
+def parse_seasons(text):
+    # "1950-2024" ya da "2021,2023"
+    seasons = []
+    for part in text.split(","):
+        if "-" in part:
+            start, end = part.split("-")
+            seasons.extend(range(int(start), int(end) + 1))
+        else:
+            seasons.append(int(part))
+    return seasons
+
+def backfill(seasons, source, archive_dir=ARCHIVE_DIR, force=False):
+    current = datetime.now().year
+    for season in seasons:
+        # Biten sezonlar bir daha indirilmez; yalnızca süren sezon yenilenebilir
+        if os.path.isdir(season_dir(season, archive_dir)) and not force and season < current:
+            print(f"{season}: arşivde var, atlandı")
+            continue
+        try:
+            print(f"{season}: {build_season(season, source, archive_dir)}")
+        except Exception as e:
+            print(f"{season}: atlandı ({e})")
+
+def record(seasons, out_dir):
+    # Canlı Ergast yanıtlarını sonraki çevrimdışı kurulumlar için fikstür olarak kaydeder
+    for season in seasons:
+        os.makedirs(os.path.join(out_dir, str(season)), exist_ok=True)
+        for endpoint in ENDPOINTS:
+            pages = live_source(season, endpoint)
+            if pages is None:
+                print(f"{season}/{endpoint}: alınamadı")
+                continue
+            with open(os.path.join(out_dir, str(season), f"{endpoint}.json"), "w", encoding="utf-8") as f:
+                json.dump(pages, f)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="F1 sezon arşivi")
+    sub = parser.add_subparsers(dest="command", required=True)
+    p_backfill = sub.add_parser("backfill", help="Arşivi fikstürlerden ya da canlı API'den oluşturur")
+    p_backfill.add_argument("--seasons", default=f"{FIRST_SEASON}-{datetime.now().year - 1}")
+    p_backfill.add_argument("--fixtures", help="Kayıtlı fikstür dizini (verilmezse canlı API)")
+    p_backfill.add_argument("--archive", default=ARCHIVE_DIR)
+    p_backfill.add_argument("--force", action="store_true")
+    p_record = sub.add_parser("record", help="Canlı yanıtları fikstür olarak kaydeder")
+    p_record.add_argument("--seasons", required=True)
+    p_record.add_argument("--out", default="fixtures")
+    args = parser.parse_args(argv)
+
+    if args.command == "backfill":
+        source = fixture_source(args.fixtures) if args.fixtures else live_source
+        backfill(parse_seasons(args.seasons), source, args.archive, args.force)
+    elif args.command == "record":
+        record(parse_seasons(args.seasons), args.out)
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,72 @@
+import os
+import io
+import sys
+import time
+import base64
+import hashlib
+
+# --- LOGO VARLIK HATTI ---
+# Logolar bir kez avatar boyutuna küçültülür ve içerik özetiyle (hash)
+# anahtarlanarak diske yazılır; sonraki çalıştırmalar hazır dosyayı okur.
+ASSET_DIR = "assets"
+AVATAR_BOX = (60, 45)  # CSS'teki logo avatarı (genişlik, yükseklik)
+RETINA_SCALE = 2       # Yüksek DPI ekranlarda bulanıklaşmaması için 2x
+
+def content_hash(data):
+    return hashlib.sha1(data).hexdigest()[:16]
+
+def build_logo(file_path, asset_dir=ASSET_DIR):
+    """
+    Logoyu avatar kutusuna sığacak şekilde küçültür ve önbellek yolunu döner.
+    Aynı içerik için dosya zaten varsa yeniden işlenmez.
+    """
+    with open(file_path, "rb") as f:
+        data = f.read()
+    w, h = AVATAR_BOX[0] * RETINA_SCALE, AVATAR_BOX[1] * RETINA_SCALE
+    stem = os.path.splitext(os.path.basename(file_path))[0]
+    out_path = os.path.join(asset_dir, f"{stem}-{content_hash(data)}-{w}x{h}.png")
+    if os.path.exists(out_path):
+        return out_path
+
+    from PIL import Image
+    img = Image.open(io.BytesIO(data)).convert("RGBA")
+    img.thumbnail((w, h), Image.LANCZOS)
+    os.makedirs(asset_dir, exist_ok=True)
+    tmp_path = f"{out_path}.tmp"
+    img.save(tmp_path, format="PNG", optimize=True)
+    os.replace(tmp_path, out_path)
+    return out_path
+
+def to_data_uri(file_path):
+    with open(file_path, "rb") as f:
+        return f"data:image/png;base64,{base64.b64encode(f.read()).decode()}"
+
+def logo_data_uri(file_path):
+    # Küçültme başarısız olursa (ör. Pillow yok) orijinal dosyaya dön
+    try:
+        return to_data_uri(build_logo(file_path))
+    except Exception as e:
+        print(f"Logo işlenemedi ({file_path}): {e}")
+        return to_data_uri(file_path)
+
+def measure(files):
+    """Orijinal ve küçültülmüş logolar için CPU süresi ve HTML yükünü karşılaştırır."""
+    t0 = time.process_time()
+    before = {f: to_data_uri(f) for f in files}
+    t_before = time.process_time() - t0
+
+    for f in files: build_logo(f)  # Önbelleği ısıt
+    t0 = time.process_time()
+    after = {f: logo_data_uri(f) for f in files}
+    t_after = time.process_time() - t0
+
+    print(f"{'logo':<20}{'önce (B)':>12}{'sonra (B)':>12}")
+    for f in files:
+        print(f"{f:<20}{len(before[f]):>12}{len(after[f]):>12}")
+    print(f"{'TOPLAM':<20}{sum(map(len, before.values())):>12}{sum(map(len, after.values())):>12}")
+    print(f"Yeniden çalıştırma başına CPU: önce {t_before * 1000:.1f} ms, sonra {t_after * 1000:.1f} ms (önbellekli, memoize edilmeden)")
+
+if __name__ == "__main__":
+    # Kullanım: python f1Assets.py [logo.png ...]
+    logos = sys.argv[1:] or sorted(f for f in os.listdir(".") if f.endswith(".png"))
+    measure(logos)
@@ -0,0 +1,480 @@
+import os
+import sys
+import json
+import time
+import random
+import shutil
+import argparse
+import functools
+import tempfile
+import statistics
+import subprocess
+import tracemalloc
+from urllib.parse import urlsplit, parse_qs
+from datetime import datetime, timedelta, timezone
+
+# --- ÖLÇÜM DÜZENEĞİ ---
+# Veri katmanı ve HTML oluşturucular canlı servislere gitmeden, kayıtlı Ergast
+# fikstürleri ve sahte bir FastF1 kaynağıyla çalıştırılır. Fikstür düzeni
+# f1Archive ile aynıdır (<dizin>/<sezon>/<uç nokta>.json); "python f1Archive.py record"
+# ile gerçek yanıtlar kaydedilebilir ya da "fixtures" komutuyla sentetik bir sezon üretilir.
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+APP_SCRIPT = os.path.join(REPO_DIR, "f1Takip.py")
+TABS = ("drivers", "constructors", "calendar")
+FIXTURE_SEASON = 2025
+RENDER_REPEAT = 20
+
+# --- SENTETİK FİKSTÜRLER ---
+# (driverId, kod, ad, soyad, constructorId, takım adı)
+FIXTURE_GRID = [
+    ("norris", "NOR", "Lando", "Norris", "mclaren", "McLaren"), ("piastri", "PIA", "Oscar", "Piastri", "mclaren", "McLaren"),
+    ("max_verstappen", "VER", "Max", "Verstappen", "red_bull", "Red Bull"), ("tsunoda", "TSU", "Yuki", "Tsunoda", "red_bull", "Red Bull"),
+    ("leclerc", "LEC", "Charles", "Leclerc", "ferrari", "Ferrari"), ("hamilton", "HAM", "Lewis", "Hamilton", "ferrari", "Ferrari"),
+    ("russell", "RUS", "George", "Russell", "mercedes", "Mercedes"), ("bottas", "BOT", "Valtteri", "Bottas", "mercedes", "Mercedes"),
+    ("alonso", "ALO", "Fernando", "Alonso", "aston_martin", "Aston Martin"), ("stroll", "STR", "Lance", "Stroll", "aston_martin", "Aston Martin"),
+    ("gasly", "GAS", "Pierre", "Gasly", "alpine", "Alpine F1 Team"), ("colapinto", "COL", "Franco", "Colapinto", "alpine", "Alpine F1 Team"),
+    ("albon", "ALB", "Alexander", "Albon", "williams", "Williams"), ("sainz", "SAI", "Carlos", "Sainz", "williams", "Williams"),
+    ("lawson", "LAW", "Liam", "Lawson", "rb", "RB F1 Team"), ("perez", "PER", "Sergio", "Perez", "rb", "RB F1 Team"),
+    ("hulkenberg", "HUL", "Nico", "Hulkenberg", "sauber", "Kick Sauber"), ("zhou", "ZHO", "Guanyu", "Zhou", "sauber", "Kick Sauber"),
+    ("ocon", "OCO", "Esteban", "Ocon", "haas", "Haas F1 Team"), ("bearman", "BEA", "Oliver", "Bearman", "haas", "Haas F1 Team")
+]
+RACE_POINTS = [25, 18, 15, 12, 10, 8, 6, 4, 2, 1]
+SPRINT_POINTS = [8, 7, 6, 5, 4, 3, 2, 1]
+
+def mrdata(season, table, total=None, **content):
+    return {"MRData": {"limit": "100", "offset": "0", "total": str(total if total is not None else 1),
+                       table: {"season": str(season), **content}}}
+
+def result_row(pos, entry, points, status="Finished", fastest=False, grid=None):
+    driver_id, code, given, family, constructor_id, constructor = entry
+    row = {
+        "number": str(pos), "position": str(pos), "positionText": "R" if status != "Finished" else str(pos),
+        "points": str(points), "grid": str(grid or pos), "status": status,
+        "Driver": {"driverId": driver_id, "code": code, "givenName": given, "familyName": family},
+        "Constructor": {"constructorId": constructor_id, "name": constructor}
+    }
+    if fastest: row["FastestLap"] = {"rank": "1"}
+    return row
+
+def generate_fixtures(out_dir, season=FIXTURE_SEASON, rounds=24, completed=18, now=None):
+    """
+    Gerçek Ergast biçiminde, tohumlu (tekrarlanabilir) bir sezon üretir. Son biten turun
+    yarış sonucu bilerek eksik bırakılır; böylece FastF1 yedek yolu da ölçülür.
+    FastF1'in o tur için döndüreceği podyumu da döner.
+    """
+    rng = random.Random(season)
+    now = now or datetime.now(timezone.utc)
+    races, results, sprints, qualifying = [], [], [], []
+    driver_points, constructor_points, driver_wins, constructor_wins = {}, {}, {}, {}
+    fastf1_podiums = {}
+    for rnd in range(1, rounds + 1):
+        race_dt = (now + timedelta(days=7 * (rnd - completed) - 3.5)).replace(hour=13, minute=0, second=0, microsecond=0)
+        day = lambda offset: (race_dt - timedelta(days=offset)).strftime("%Y-%m-%d")
+        is_sprint = rnd % 4 == 2
+        race = {
+            "season": str(season), "round": str(rnd), "raceName": f"Grand Prix {rnd}",
+            "Circuit": {"circuitId": f"circuit_{rnd}", "circuitName": f"Circuit {rnd}"},
+            "date": race_dt.strftime("%Y-%m-%d"), "time": "13:00:00Z",
+            "FirstPractice": {"date": day(2), "time": "11:30:00Z"},
+            "Qualifying": {"date": day(1), "time": "15:00:00Z"}
+        }
+        if is_sprint:
+            race["SprintQualifying"] = {"date": day(2), "time": "15:30:00Z"}
+            race["Sprint"] = {"date": day(1), "time": "11:00:00Z"}
+        else:
+            race["SecondPractice"] = {"date": day(2), "time": "15:00:00Z"}
+            race["ThirdPractice"] = {"date": day(1), "time": "11:30:00Z"}
+        races.append(race)
+        if rnd > completed: continue
+
+        base = {k: race[k] for k in ("season", "round", "raceName", "Circuit", "date", "time")}
+        grid = rng.sample(FIXTURE_GRID, len(FIXTURE_GRID))
+        qualifying.append({**base, "QualifyingResults": [
+            {"number": str(p), "position": str(p), "Driver": result_row(p, e, 0)["Driver"], "Constructor": result_row(p, e, 0)["Constructor"]}
+            for p, e in enumerate(grid, 1)
+        ]})
+        if is_sprint:
+            order = rng.sample(FIXTURE_GRID, len(FIXTURE_GRID))
+            sprints.append({**base, "SprintResults": [
+                result_row(p, e, SPRINT_POINTS[p - 1] if p <= len(SPRINT_POINTS) else 0) for p, e in enumerate(order, 1)
+            ]})
+            for p, e in enumerate(order, 1):
+                pts = SPRINT_POINTS[p - 1] if p <= len(SPRINT_POINTS) else 0
+                driver_points[e[0]] = driver_points.get(e[0], 0) + pts
+                constructor_points[e[4]] = constructor_points.get(e[4], 0) + pts
+
+        order = rng.sample(FIXTURE_GRID, len(FIXTURE_GRID))
+        dnfs = set(rng.sample(range(15, 21), rng.randint(0, 3)))
+        fastest = rng.randint(1, 10)
+        rows = []
+        for p, e in enumerate(order, 1):
+            pts = (RACE_POINTS[p - 1] if p <= len(RACE_POINTS) else 0) + (1 if p == fastest else 0)
+            rows.append(result_row(p, e, pts, "Accident" if p in dnfs else "Finished", p == fastest, grid.index(e) + 1))
+            driver_points[e[0]] = driver_points.get(e[0], 0) + pts
+            constructor_points[e[4]] = constructor_points.get(e[4], 0) + pts
+        driver_wins[order[0][0]] = driver_wins.get(order[0][0], 0) + 1
+        constructor_wins[order[0][4]] = constructor_wins.get(order[0][4], 0) + 1
+        if rnd == completed:
+            fastf1_podiums[rnd] = [e[1] for e in order[:3]]
+        else:
+            results.append({**base, "Results": rows})
+
+    entries = {e[0]: e for e in FIXTURE_GRID}
+    driver_standings = [
+        {"position": str(i), "positionText": str(i), "points": str(pts), "wins": str(driver_wins.get(d, 0)),
+         "Driver": result_row(i, entries[d], 0)["Driver"], "Constructors": [result_row(i, entries[d], 0)["Constructor"]]}
+        for i, (d, pts) in enumerate(sorted(driver_points.items(), key=lambda kv: -kv[1]), 1)
+    ]
+    teams = {e[4]: e[5] for e in FIXTURE_GRID}
+    constructor_standings = [
+        {"position": str(i), "positionText": str(i), "points": str(pts), "wins": str(constructor_wins.get(c, 0)),
+         "Constructor": {"constructorId": c, "name": teams[c]}}
+        for i, (c, pts) in enumerate(sorted(constructor_points.items(), key=lambda kv: -kv[1]), 1)
+    ]
+
+    files = {
+        "calendar": mrdata(season, "RaceTable", len(races), Races=races),
+        "results": mrdata(season, "RaceTable", sum(len(r["Results"]) for r in results), Races=results),
+        "sprint": mrdata(season, "RaceTable", sum(len(r["SprintResults"]) for r in sprints), Races=sprints),
+        "qualifying": mrdata(season, "RaceTable", sum(len(r["QualifyingResults"]) for r in qualifying), Races=qualifying),
+        "driverStandings": mrdata(season, "StandingsTable", len(driver_standings), StandingsLists=[
+            {"season": str(season), "round": str(completed), "DriverStandings": driver_standings}]),
+        "constructorStandings": mrdata(season, "StandingsTable", len(constructor_standings), StandingsLists=[
+            {"season": str(season), "round": str(completed), "ConstructorStandings": constructor_standings}])
+    }
+    season_dir = os.path.join(out_dir, str(season))
+    os.makedirs(season_dir, exist_ok=True)
+    for name, content in files.items():
+        with open(os.path.join(season_dir, f"{name}.json"), "w", encoding="utf-8") as f:
+            json.dump([content], f)
+    with open(os.path.join(season_dir, "fastf1.json"), "w", encoding="utf-8") as f:
+        json.dump({str(rnd): top3 for rnd, top3 in fastf1_podiums.items()}, f)
+    return fastf1_podiums
+
+# --- SAHTE KAYNAKLAR ---
+class FixtureAPI:
+    """
+    f1Data.fetch_api yerine geçer: istenen Ergast URL'sini fikstürlerden yanıtlar.
+    Sezon sorgularında limit/offset sayfalaması ve tur bazlı uç noktalar taklit edilir;
+    latency her isteğe eklenen yapay ağ gecikmesidir.
+    """
+    def __init__(self, fixture_dir, season, latency=0.0):
+        import f1Archive
+        import f1Data
+        source = f1Archive.fixture_source(fixture_dir)
+        self.season = str(season)
+        self.latency = latency
+        self.pages = {endpoint: source(season, endpoint) or [] for endpoint in f1Archive.ENDPOINTS}
+        self.races = {kind: f1Data.merge_races(self.pages[kind], kind) for kind in f1Data.RESULT_KEYS}
+
+    def race_table(self, kind, rounds, limit, offset):
+        import f1Data
+        key = f1Data.RESULT_KEYS[kind]
+        rows = [(rnd, row) for rnd in sorted(rounds) for row in self.races[kind][rnd][key]]
+        page, races = rows[offset:offset + limit], {}
+        for rnd, row in page:
+            races.setdefault(rnd, {**{k: v for k, v in self.races[kind][rnd].items() if k != key}, key: []})[key].append(row)
+        response = mrdata(self.season, "RaceTable", len(rows), Races=list(races.values()))
+        response["MRData"].update(limit=str(limit), offset=str(offset))
+        return response
+
+    def respond(self, url):
+        import f1Data
+        parts = urlsplit(url)
+        path = parts.path.split("/ergast/f1/", 1)[1].replace("current", self.season)
+        query = parse_qs(parts.query)
+        limit, offset = int(query.get("limit", ["30"])[0]), int(query.get("offset", ["0"])[0])
+        segments = path[:-len(".json")].split("/")
+        if segments[0] != self.season: return None
+        if len(segments) == 1: return self.pages["calendar"][0] if self.pages["calendar"] else None
+        if segments[-1] in f1Data.RESULT_KEYS:
+            kind = segments[-1]
+            rounds = self.races[kind].keys() if len(segments) == 2 else [r for r in self.races[kind] if r == int(segments[1])]
+            return self.race_table(kind, rounds, limit, offset)
+        pages = self.pages.get(segments[-1])
+        return pages[0] if pages else None
+
+    def __call__(self, url, timeout=None):
+        import f1Metrics
+        import f1Data
+        with f1Metrics.timed("fetch", url.replace(f1Data.API_BASE, "").split("?")[0]) as info:
+            time.sleep(self.latency)
+            response = self.respond(url)
+            info.update(ok=response is not None, bytes=len(json.dumps(response)) if response else 0)
+            return response
+
+def fake_load_podium(podiums, delay, season, round_num, event_name):
+    # f1Store.load_podium yerine; forkserver işçileri modül durumunu görmediği için
+    # podyumlar ve gecikme functools.partial ile argüman olarak taşınır
+    time.sleep(delay)
+    return round_num, podiums.get(int(round_num)), delay
+
+class FakeFastF1:
+    """Yalnızca f1Data'nın kullandığı get_event_schedule'ı fikstür takviminden üretir."""
+    def __init__(self, api):
+        self.api = api
+
+    def get_event_schedule(self, season):
+        import pandas as pd
+        races = self.api.pages["calendar"][0]["MRData"]["RaceTable"]["Races"]
+        return pd.DataFrame({
+            "RoundNumber": [int(r["round"]) for r in races],
+            "EventName": [r["raceName"] for r in races],
+            "EventDate": [datetime.strptime(r["date"], "%Y-%m-%d") for r in races]
+        })
+
+def install_fakes(fixture_dir, season, latency=0.0, fastf1_delay=0.0):
+    import f1Data
+    import f1Store
+    api = FixtureAPI(fixture_dir, season, latency)
+    podiums, podium_file = {}, os.path.join(fixture_dir, str(season), "fastf1.json")
+    if os.path.exists(podium_file):
+        with open(podium_file, encoding="utf-8") as f:
+            podiums = {int(rnd): top3 for rnd, top3 in json.load(f).items()}
+    f1Data.fetch_api = api
+    f1Data._fastf1 = FakeFastF1(api)
+    f1Store.PODIUM_LOADER = functools.partial(fake_load_podium, podiums, fastf1_delay)
+    return api
+
+def reset_process_state():
+    import f1Data
+    import f1Ingest
+    import f1Metrics
+    f1Data.STATS_TOTALS.clear()
+    f1Ingest._cache.update(mtime=None, snapshot=None, path=None)
+    f1Metrics.clear()
+
+# --- YALITIM ---
+# Veri katmanı depo, anlık görüntü ve önbellek yollarını modül yüklenirken ortam
+# değişkenlerinden alır. Ölçüm bu varsayılanlar üzerinden yazdığı için hepsi geçici
+# çalışma dizininin içinde kalmalıdır; aksi halde canlı veriye sentetik sonuç yazılır.
+ISOLATED_PATHS = {
+    "F1_SNAPSHOT_PATH": ("f1Ingest", "SNAPSHOT_PATH"),
+    "F1_STORE_PATH": ("f1Store", "STORE_PATH"),
+    "F1_FASTF1_CACHE": ("f1Cache", "CACHE_DIR")
+}
+SNAPSHOT_NAME = "f1_snapshot.pkl"
+
+def check_isolated(workdir):
+    # Çalışma dizini (cwd) workdir iken çağrılır; göreli yollar oraya çözülür
+    for env_name, (module, attr) in ISOLATED_PATHS.items():
+        value = getattr(__import__(module), attr)
+        if os.path.commonpath([os.path.abspath(value), workdir]) != workdir:
+            raise SystemExit(f"{env_name}={value} ölçüm dizininin dışında; canlı veriyi korumak için "
+                             f"ölçüm çalıştırılmadı. Değişkeni kaldırıp yeniden deneyin.")
+
+def isolated_env(workdir):
+    # Alt süreçteki uygulama da yalnızca geçici dizindeki dosyaları kullanır
+    return {
+        "F1_SNAPSHOT_PATH": os.path.join(workdir, SNAPSHOT_NAME),
+        "F1_STORE_PATH": os.path.join(workdir, "f1_store.db"),
+        "F1_FASTF1_CACHE": os.path.join(workdir, "cache"),
+        "F1_ARCHIVE_DIR": os.path.join(workdir, "archive"),
+        "F1_TELEMETRY_DIR": os.path.join(workdir, "telemetry")
+    }
+
+# --- ÖLÇÜMLER ---
+def measure(func, repeat=1):
+    """Fonksiyonu çalıştırır; (son sonuç, medyan süre sn, tepe bellek bayt) döner."""
+    times, peak, result = [], 0, None
+    for _ in range(repeat):
+        tracemalloc.start()
+        t0 = time.perf_counter()
+        result = func()
+        times.append(time.perf_counter() - t0)
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+    return result, statistics.median(times), peak
+
+def fetch_totals():
+    import f1Metrics
+    fetches = f1Metrics.events("fetch")
+    return {"requests": len(fetches), "bytes": sum(e.get("bytes", 0) for e in fetches)}
+
+def bench_data(fixture_dir, season, latency, fastf1_delay, snapshot_path):
+    """Soğuk yükleme, sıcak yenileme ve anlık görüntüden yeniden çalıştırma ölçümleri."""
+    import f1Data
+    import f1Ingest
+    import f1Metrics
+    install_fakes(fixture_dir, season, latency, fastf1_delay)
+    reset_process_state()
+    report = {}
+
+    data, seconds, peak = measure(f1Data.get_all_data)
+    report["cold_load"] = {"ms": seconds * 1000, "peak_kb": peak / 1024, **fetch_totals(),
+                           "fastf1_loads": len(f1Metrics.events("fastf1"))}
+
+    f1Metrics.clear()
+    _, seconds, peak = measure(f1Data.get_all_data)
+    report["warm_refresh"] = {"ms": seconds * 1000, "peak_kb": peak / 1024, **fetch_totals(),
+                              "fastf1_loads": len(f1Metrics.events("fastf1"))}
+
+    f1Ingest.write_snapshot(data, snapshot_path)
+    _, seconds, peak = measure(lambda: f1Ingest.read_snapshot(snapshot_path), repeat=1)
+    report["snapshot_cold_read"] = {"ms": seconds * 1000, "peak_kb": peak / 1024}
+    _, seconds, peak = measure(lambda: f1Ingest.read_snapshot(snapshot_path)["data"], repeat=RENDER_REPEAT)
+    report["warm_rerun"] = {"ms": seconds * 1000, "peak_kb": peak / 1024}
+    return data, report
+
+def bench_render(data, repeat=RENDER_REPEAT):
+    """Sekme başına HTML oluşturma süresi, tepe bellek ve gönderilen yük boyutu."""
+    import f1Assets
+    import f1Registry
+    import f1Render
+    registry = f1Registry.Registry(logo_loader=lambda path: f1Assets.logo_data_uri(os.path.join(REPO_DIR, path)))
+    drivers, constructors, calendar = data
+    renderers = {
+        "drivers": lambda: f1Render.render_drivers(drivers, registry.color_of, registry.portrait_of),
+        "constructors": lambda: f1Render.render_constructors(constructors, registry.color_of, registry.logo_of),
+        "calendar": lambda: f1Render.render_calendar(calendar)
+    }
+    report = {}
+    for tab in TABS:
+        html, seconds, peak = measure(renderers[tab], repeat)
+        report[tab] = {"ms": seconds * 1000, "peak_kb": peak / 1024, "payload_kb": len(html.encode()) / 1024}
+    return report
+
+def run(fixture_dir=None, season=FIXTURE_SEASON, latency=0.05, fastf1_delay=0.5, repeat=RENDER_REPEAT):
+    """
+    Tüm ölçümleri geçici bir çalışma dizininde yapar. Depo, anlık görüntü ya da önbellek
+    yolu bu dizinin dışını gösteriyorsa (ör. mutlak F1_STORE_PATH) çalışmayı reddeder.
+    """
+    workdir = os.path.realpath(tempfile.mkdtemp(prefix="f1bench-"))
+    cwd = os.getcwd()
+    try:
+        if fixture_dir is None:
+            fixture_dir = os.path.join(workdir, "fixtures")
+            generate_fixtures(fixture_dir, season)
+        fixture_dir = os.path.abspath(fixture_dir)
+        os.chdir(workdir)
+        check_isolated(workdir)
+        data, data_report = bench_data(fixture_dir, season, latency, fastf1_delay, os.path.join(workdir, SNAPSHOT_NAME))
+        return {"season": season, "latency_ms": latency * 1000, "data": data_report, "render": bench_render(data, repeat)}
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(workdir, ignore_errors=True)
+
+def print_report(report):
+    print(f"Sezon {report['season']}, istek gecikmesi {report['latency_ms']:.0f} ms")
+    print(f"{'veri':<20}{'süre (ms)':>12}{'tepe (KB)':>12}{'istek':>8}{'yük (KB)':>10}{'FastF1':>8}")
+    for name, row in report["data"].items():
+        payload = f"{row['bytes'] / 1024:.0f}" if "bytes" in row else ""
+        print(f"{name:<20}{row['ms']:>12.2f}{row['peak_kb']:>12.0f}{row.get('requests', ''):>8}"
+              f"{payload:>10}{row.get('fastf1_loads', ''):>8}")
+    print(f"{'sekme':<20}{'süre (ms)':>12}{'tepe (KB)':>12}{'HTML (KB)':>12}")
+    for tab, row in report["render"].items():
+        print(f"{tab:<20}{row['ms']:>12.2f}{row['peak_kb']:>12.0f}{row['payload_kb']:>12.1f}")
+
+# --- BAŞLANGIÇ ÖLÇÜMÜ ---
+# Her ölçüm temiz bir süreçte yapılır (soğuk başlangıç): uygulamanın modül düzeyindeki
+# içe aktarmaları ve betiğin ilk tam çalıştırması (ilk boyama) süre bütçesiyle karşılaştırılır.
+APP_IMPORTS = ("streamlit", "f1Ingest", "f1Archive", "f1Assets", "f1Render", "f1Registry", "f1Live", "f1Telemetry", "f1Metrics")
+IMPORT_BUDGET_S = 2.0
+FIRST_RENDER_BUDGET_S = 3.0
+# İlk boyamada yüklenmemesi gereken ağır bağımlılıklar
+LAZY_MODULES = ("fastf1",)
+
+STARTUP_PROBE = """
+import sys, time, json
+t0 = time.perf_counter()
+for name in {imports!r}:
+    __import__(name)
+t_import = time.perf_counter() - t0
+from streamlit.testing.v1 import AppTest
+t1 = time.perf_counter()
+at = AppTest.from_file({script!r}, default_timeout=60).run()
+t_render = time.perf_counter() - t1
+print(json.dumps({{
+    "import_s": t_import, "first_render_s": t_render,
+    "loaded_lazy": [m for m in {lazy!r} if m in sys.modules],
+    "exceptions": [str(e.value) for e in at.exception]
+}}))
+"""
+
+def probe_startup(workdir, script=APP_SCRIPT, env=None):
+    code = STARTUP_PROBE.format(imports=APP_IMPORTS, script=script, lazy=LAZY_MODULES)
+    # Depo dizini mevcut PYTHONPATH'in önüne eklenir; bağımlılıklar oradan geliyor olabilir
+    pythonpath = os.pathsep.join(p for p in (REPO_DIR, os.environ.get("PYTHONPATH")) if p)
+    env = {**os.environ, "F1_NO_REFRESHER": "1", "PYTHONPATH": pythonpath, **(env or {})}
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=env, cwd=workdir, check=True).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+def prepare_startup_dir(workdir, fixture_dir=None, season=FIXTURE_SEASON):
+    # Uygulama fikstürlerden üretilmiş bir anlık görüntü ve logolarla, ağsız başlatılır
+    import f1Data
+    import f1Ingest
+    if fixture_dir is None:
+        fixture_dir = os.path.join(workdir, "fixtures")
+        generate_fixtures(fixture_dir, season)
+    cwd = os.getcwd()
+    os.chdir(workdir)
+    try:
+        check_isolated(workdir)
+        install_fakes(os.path.abspath(os.path.join(cwd, fixture_dir)), season)
+        reset_process_state()
+        f1Ingest.write_snapshot(f1Data.get_all_data(), os.path.join(workdir, SNAPSHOT_NAME))
+    finally:
+        os.chdir(cwd)
+    for name in os.listdir(REPO_DIR):
+        if name.endswith(".png"):
+            os.symlink(os.path.join(REPO_DIR, name), os.path.join(workdir, name))
+
+def bench_startup(repeat=3, import_budget=IMPORT_BUDGET_S, render_budget=FIRST_RENDER_BUDGET_S, fixture_dir=None, env=None):
+    """Bütçe aşılırsa ya da ağır bir modül erken yüklenirse başarısızlık listesi döner."""
+    workdir = os.path.realpath(tempfile.mkdtemp(prefix="f1startup-"))
+    try:
+        prepare_startup_dir(workdir, fixture_dir)
+        runs = [probe_startup(workdir, env={**isolated_env(workdir), **(env or {})}) for _ in range(repeat)]
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+    import_s = statistics.median(r["import_s"] for r in runs)
+    render_s = statistics.median(r["first_render_s"] for r in runs)
+    print(f"İçe aktarma: {import_s * 1000:.0f} ms (bütçe {import_budget * 1000:.0f} ms)")
+    print(f"İlk boyama: {render_s * 1000:.0f} ms (bütçe {render_budget * 1000:.0f} ms)")
+
+    failures = []
+    if import_s > import_budget: failures.append("içe aktarma bütçesi aşıldı")
+    if render_s > render_budget: failures.append("ilk boyama bütçesi aşıldı")
+    for r in runs:
+        failures += [f"ilk boyamada yüklendi: {m}" for m in r["loaded_lazy"]]
+        failures += [f"betik hatası: {e}" for e in r["exceptions"]]
+    return sorted(set(failures))
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="F1 uygulaması performans ölçümleri")
+    sub = parser.add_subparsers(dest="command", required=True)
+    p_fixtures = sub.add_parser("fixtures", help="Sentetik Ergast fikstürleri üretir")
+    p_fixtures.add_argument("--out", default="fixtures")
+    p_fixtures.add_argument("--season", type=int, default=FIXTURE_SEASON)
+    p_fixtures.add_argument("--rounds", type=int, default=24)
+    p_fixtures.add_argument("--completed", type=int, default=18)
+    p_run = sub.add_parser("run", help="Veri katmanı ve sekmeleri fikstürlerle ölçer")
+    p_run.add_argument("--fixtures", help="Fikstür dizini (verilmezse sentetik sezon üretilir)")
+    p_run.add_argument("--season", type=int, default=FIXTURE_SEASON)
+    p_run.add_argument("--latency", type=float, default=0.05, help="İstek başına yapay gecikme (sn)")
+    p_run.add_argument("--fastf1-delay", type=float, default=0.5, help="Sahte FastF1 yükleme süresi (sn)")
+    p_run.add_argument("--repeat", type=int, default=RENDER_REPEAT)
+    p_run.add_argument("--json", help="Raporu JSON olarak da yazar")
+    p_startup = sub.add_parser("startup", help="Soğuk başlangıç süresini bütçeyle karşılaştırır")
+    p_startup.add_argument("--fixtures")
+    p_startup.add_argument("--repeat", type=int, default=3)
+    p_startup.add_argument("--import-budget", type=float, default=IMPORT_BUDGET_S)
+    p_startup.add_argument("--render-budget", type=float, default=FIRST_RENDER_BUDGET_S)
+    args = parser.parse_args(argv)
+
+    if args.command == "fixtures":
+        generate_fixtures(args.out, args.season, args.rounds, args.completed)
+    elif args.command == "run":
+        report = run(args.fixtures, args.season, args.latency, args.fastf1_delay, args.repeat)
+        print_report(report)
+        if args.json:
+            with open(args.json, "w", encoding="utf-8") as f:
+                json.dump(report, f, indent=2)
+    elif args.command == "startup":
+        failures = bench_startup(args.repeat, args.import_budget, args.render_budget, args.fixtures)
+        for failure in failures:
+            print(f"HATA: {failure}")
+        return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,253 @@
+import os
+import sys
+import time
+import pickle
+import shutil
+import sqlite3
+import tarfile
+import tempfile
+import argparse
+from datetime import datetime
+from f1Archive import parse_seasons
+
+# --- FASTF1 ÖNBELLEK YÖNETİMİ ---
+# FastF1 önbelleği cache/<sezon>/<etkinlik>/<seans>/ düzenindedir. Yönetici bu dizini
+# bir boyut sınırında tutar (en uzun süredir kullanılmayan sezon ve seanslar silinir),
+# bozuk dosyaları ayıklar ve dağıtım öncesi önbelleği doldurmak için komutlar sunar.
+CACHE_DIR = os.environ.get("F1_FASTF1_CACHE", "cache")
+CACHE_MAX_BYTES = int(float(os.environ.get("F1_CACHE_MAX_MB", "2048")) * 1024 * 1024)
+HTTP_CACHE_FILE = "fastf1_http_cache.sqlite"
+BUNDLE_STORE_NAME = "f1_store.db"  # Paket içindeki depo adı; F1_STORE_PATH'ten bağımsız
+
+def enable_cache(fastf1, cache_dir=CACHE_DIR):
+    os.makedirs(cache_dir, exist_ok=True)
+    fastf1.Cache.enable_cache(cache_dir)
+
+# Son kullanım seans dizinindeki işaret dosyasının mtime'ıdır; noatime/relatime
+# bağlanan dosya sistemlerinde st_atime okumalarla güncellenmediği için ona güvenilmez.
+LAST_USED_MARKER = ".last_used"
+
+def session_path(session, cache_dir=CACHE_DIR):
+    # FastF1 seans dosyalarını api_path'in "/static/" sonrası altında tutar
+    return os.path.join(cache_dir, session.api_path[len("/static/"):])
+
+def touch_session(session, cache_dir=CACHE_DIR):
+    """Yüklenen seansı kullanıldı olarak işaretler (LRU silme sırası için)."""
+    try:
+        path = session_path(session, cache_dir)
+        if os.path.isdir(path):
+            marker = os.path.join(path, LAST_USED_MARKER)
+            open(marker, "a").close()
+            os.utime(marker)
+    except (AttributeError, OSError):
+        pass
+
+def dir_stats(path):
+    size, last_used = 0, 0.0
+    for root, _, files in os.walk(path):
+        for name in files:
+            st = os.stat(os.path.join(root, name))
+            size += st.st_size
+            last_used = max(last_used, st.st_mtime)
+    return size, last_used
+
+def session_units(cache_dir=CACHE_DIR):
+    """Önbellekteki her seans dizini için (sezon, yol, boyut, son kullanım) döner."""
+    units = []
+    if not os.path.isdir(cache_dir): return units
+    for season in sorted(os.listdir(cache_dir)):
+        season_path = os.path.join(cache_dir, season)
+        if not (season.isdigit() and os.path.isdir(season_path)): continue
+        for event in os.listdir(season_path):
+            event_path = os.path.join(season_path, event)
+            if not os.path.isdir(event_path): continue
+            for session in os.listdir(event_path):
+                session_path = os.path.join(event_path, session)
+                if os.path.isdir(session_path):
+                    units.append((int(season), session_path, *dir_stats(session_path)))
+    return units
+
+def cache_size(cache_dir=CACHE_DIR):
+    return dir_stats(cache_dir)[0] if os.path.isdir(cache_dir) else 0
+
+def remove_empty_dirs(cache_dir=CACHE_DIR):
+    for root, _, _ in os.walk(cache_dir, topdown=False):
+        if root != cache_dir and not os.listdir(root):
+            os.rmdir(root)
+
+def enforce_limit(max_bytes=CACHE_MAX_BYTES, cache_dir=CACHE_DIR):
+    """
+    Önbellek sınırı aşıyorsa önce en uzun süredir kullanılmayan sezonun,
+    o sezon içinde de en eski seansların dizinlerini siler. Silinen bayt sayısını döner.
+    """
+    total = cache_size(cache_dir)
+    if total <= max_bytes: return 0
+    units = session_units(cache_dir)
+    season_used = {}
+    for season, _, _, last_used in units:
+        season_used[season] = max(season_used.get(season, 0), last_used)
+    units.sort(key=lambda u: (season_used[u[0]], u[3]))
+    freed = 0
+    for season, path, size, _ in units:
+        if total - freed <= max_bytes: break
+        shutil.rmtree(path, ignore_errors=True)
+        freed += size
+        print(f"Önbellekten silindi: {path} ({size / 1e6:.1f} MB)")
+    remove_empty_dirs(cache_dir)
+    return freed
+
+def check_integrity(cache_dir=CACHE_DIR, repair=True):
+    """
+    Okunamayan ya da boş seans dosyalarını bulur; repair=True ise ilgili seans
+    dizinini siler (bir sonraki yüklemede yeniden indirilir). Bozuk yolları döner.
+    """
+    broken = []
+    for _, path, _, _ in session_units(cache_dir):
+        for name in os.listdir(path):
+            file_path = os.path.join(path, name)
+            if not name.endswith(".ff1pkl"): continue
+            try:
+                if os.path.getsize(file_path) == 0: raise ValueError("boş dosya")
+                with open(file_path, "rb") as f:
+                    pickle.load(f)
+            except Exception as e:
+                broken.append(path)
+                print(f"Bozuk önbellek: {file_path} ({e})")
+                break
+    http_cache = os.path.join(cache_dir, HTTP_CACHE_FILE)
+    if os.path.exists(http_cache):
+        with sqlite3.connect(http_cache) as con:
+            if con.execute("PRAGMA integrity_check").fetchone()[0] != "ok":
+                broken.append(http_cache)
+    if repair:
+        for path in broken:
+            if os.path.isdir(path): shutil.rmtree(path, ignore_errors=True)
+            else: os.remove(path)
+        remove_empty_dirs(cache_dir)
+    return broken
+
+def compact(cache_dir=CACHE_DIR):
+    # Yarım kalmış geçici dosyaları ve boş dizinleri temizler, HTTP önbelleğini sıkıştırır
+    for root, _, files in os.walk(cache_dir):
+        for name in files:
+            if name.endswith((".tmp", ".part")):
+                os.remove(os.path.join(root, name))
+    remove_empty_dirs(cache_dir)
+    http_cache = os.path.join(cache_dir, HTTP_CACHE_FILE)
+    if os.path.exists(http_cache):
+        con = sqlite3.connect(http_cache)
+        con.execute("VACUUM")
+        con.close()
+
+def prewarm(seasons, rounds=None, sessions=("R",), full=False, cache_dir=CACHE_DIR):
+    """
+    Verilen sezonların biten turlarını önceden yükler. Yarış seansı için podyum
+    f1Store deposuna da yazılır; böylece canlıdaki ilk istek session.load() yapmaz.
+    """
+    import fastf1
+    import f1Store
+    enable_cache(fastf1, cache_dir)
+    for season in seasons:
+        schedule = fastf1.get_event_schedule(season)
+        completed = schedule[(schedule['EventDate'] < datetime.now()) & (schedule['RoundNumber'] > 0)]
+        if rounds: completed = completed[completed['RoundNumber'].isin(rounds)]
+        for round_num, event_name in zip(completed['RoundNumber'], completed['EventName']):
+            for identifier in sessions:
+                t0 = time.perf_counter()
+                try:
+                    session = fastf1.get_session(season, int(round_num), identifier)
+                    session.load(laps=full, telemetry=full, weather=False, messages=False)
+                    touch_session(session, cache_dir)
+                    print(f"{season} R{round_num} {identifier}: {time.perf_counter() - t0:.1f} s")
+                except Exception as e:
+                    print(f"{season} R{round_num} {identifier}: atlandı ({e})")
+        if "R" in sessions:
+            f1Store.update_podiums(season, list(zip(completed['RoundNumber'], completed['EventName'])))
+    enforce_limit(cache_dir=cache_dir)
+
+def export_bundle(out_path, cache_dir=CACHE_DIR):
+    with tarfile.open(out_path, "w:gz") as tar:
+        tar.add(cache_dir, arcname="cache")
+        import f1Store
+        if os.path.exists(f1Store.STORE_PATH):
+            tar.add(f1Store.STORE_PATH, arcname=BUNDLE_STORE_NAME)
+
+def merge_tree(src, dst):
+    # src altındaki dosyaları dst'de aynı göreli yollara taşır; var olanların üzerine yazar
+    for root, _, files in os.walk(src):
+        target = os.path.join(dst, os.path.relpath(root, src))
+        os.makedirs(target, exist_ok=True)
+        for name in files:
+            os.replace(os.path.join(root, name), os.path.join(target, name))
+
+def import_bundle(bundle_path, cache_dir=CACHE_DIR):
+    """
+    Hazır önbellek paketini geçici bir dizine açar; cache/ içeriğini cache_dir'e,
+    depo dosyasını f1Store.STORE_PATH'e taşır. "data" filtresi paket dışına yazmayı engeller.
+    """
+    import f1Store
+    os.makedirs(cache_dir, exist_ok=True)
+    # Geçici dizin önbelleğin yanında açılır ki taşımalar aynı dosya sisteminde kalsın
+    tmp_dir = tempfile.mkdtemp(prefix=".bundle-", dir=os.path.dirname(os.path.abspath(cache_dir)))
+    try:
+        with tarfile.open(bundle_path, "r:*") as tar:
+            for member in tar.getmembers():
+                top = member.name.split("/", 1)[0]
+                if top != "cache" and member.name != BUNDLE_STORE_NAME:
+                    raise ValueError(f"Beklenmeyen paket girdisi: {member.name}")
+            tar.extractall(tmp_dir, filter="data")
+        if os.path.isdir(os.path.join(tmp_dir, "cache")):
+            merge_tree(os.path.join(tmp_dir, "cache"), cache_dir)
+        if os.path.exists(os.path.join(tmp_dir, BUNDLE_STORE_NAME)):
+            store_dir = os.path.dirname(os.path.abspath(f1Store.STORE_PATH))
+            os.makedirs(store_dir, exist_ok=True)
+            shutil.move(os.path.join(tmp_dir, BUNDLE_STORE_NAME), f1Store.STORE_PATH)
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+    check_integrity(cache_dir)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="FastF1 önbellek yöneticisi")
+    parser.add_argument("--cache", default=CACHE_DIR)
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("status", help="Önbellek boyutunu sezon bazında gösterir")
+    p_evict = sub.add_parser("evict", help="Boyut sınırını uygular")
+    p_evict.add_argument("--max-mb", type=float, default=CACHE_MAX_BYTES / 1024 / 1024)
+    sub.add_parser("check", help="Bozuk seansları bulur ve siler")
+    sub.add_parser("compact", help="Geçici dosyaları temizler, HTTP önbelleğini sıkıştırır")
+    p_prewarm = sub.add_parser("prewarm", help="Sezon/turları önceden yükler")
+    p_prewarm.add_argument("--seasons", required=True)
+    p_prewarm.add_argument("--rounds")
+    p_prewarm.add_argument("--sessions", default="R")
+    p_prewarm.add_argument("--full", action="store_true", help="Tur ve telemetri verisini de yükler")
+    p_export = sub.add_parser("export", help="Önbelleği pakete yazar")
+    p_export.add_argument("--out", default="f1_cache_bundle.tar.gz")
+    p_import = sub.add_parser("import", help="Hazır önbellek paketini açar")
+    p_import.add_argument("bundle")
+    args = parser.parse_args(argv)
+
+    if args.command == "status":
+        seasons = {}
+        for season, _, size, _ in session_units(args.cache):
+            seasons[season] = seasons.get(season, 0) + size
+        for season, size in sorted(seasons.items()):
+            print(f"{season}: {size / 1e6:.1f} MB")
+        print(f"Toplam: {cache_size(args.cache) / 1e6:.1f} MB / sınır {CACHE_MAX_BYTES / 1e6:.0f} MB")
+    elif args.command == "evict":
+        freed = enforce_limit(int(args.max_mb * 1024 * 1024), args.cache)
+        print(f"{freed / 1e6:.1f} MB boşaltıldı")
+    elif args.command == "check":
+        broken = check_integrity(args.cache)
+        print(f"{len(broken)} bozuk girdi silindi")
+    elif args.command == "compact":
+        compact(args.cache)
+    elif args.command == "prewarm":
+        rounds = parse_seasons(args.rounds) if args.rounds else None
+        prewarm(parse_seasons(args.seasons), rounds, tuple(args.sessions.split(",")), args.full, args.cache)
+    elif args.command == "export":
+        export_bundle(args.out, args.cache)
+    elif args.command == "import":
+        import_bundle(args.bundle, args.cache)
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,353 @@
+import time
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor, wait
+from datetime import datetime
+import pytz
+import pandas as pd
+import f1Store
+import f1Stats
+import f1Cache
+import f1Metrics
+
+# --- VERİ KATMANI ---
+# Streamlit'ten bağımsızdır; hem uygulama hem de arka plan yenileyicisi (f1Ingest) kullanır.
+
+# --- FASTF1 AYARLARI ---
+# FastF1 yalnızca Ergast'ta sonucu olmayan turlar için yedektir ve ağır bir bilimsel
+# yığın yükler; bu yüzden ilk kez gerçekten gerektiğinde içe aktarılır.
+_fastf1 = None
+
+def get_fastf1():
+    global _fastf1
+    if _fastf1 is None:
+        import fastf1 # Resmi veriler için kütüphane
+        f1Cache.enable_cache(fastf1)
+        _fastf1 = fastf1
+    return _fastf1
+
+def format_session_time(date_str, time_str):
+    if not date_str or not time_str: return "TBC"
+    try:
+        dt_str = f"{date_str} {time_str}".replace("Z", "")
+        utc_dt = datetime.strptime(dt_str, '%Y-%m-%d %H:%M:%S').replace(tzinfo=pytz.utc)
+        tr_dt = utc_dt.astimezone(pytz.timezone('Europe/Istanbul'))
+        return tr_dt.strftime("%H:%M")
+    except:
+        return "TBC"
+
+# --- API İSTEMCİSİ ---
+API_BASE = "https://api.jolpi.ca/ergast/f1"
+# Uç nokta başına (bağlantı, okuma) zaman aşımı; ağır sorgulara daha uzun süre
+ENDPOINT_TIMEOUTS = {
+    "drivers": (3, 5), "constructors": (3, 5), "calendar": (3, 5),
+    "results": (3, 8), "sprint": (3, 8), "qualifying": (3, 8)
+}
+DEFAULT_TIMEOUT = (3, 5)
+FETCH_DEADLINE = 10  # Toplu çekimde en yavaş uç noktayı en fazla bu kadar bekle
+
+def make_http_session():
+    # Tüm istekler tek bir keep-alive bağlantı havuzunu paylaşır. Okuma zaman aşımları
+    # yeniden denenmez (read=0): aksi halde yavaş bir uç nokta her denemede okuma süresini
+    # baştan bekler ve havuz iş parçacığını FETCH_DEADLINE'dan çok daha uzun tutar.
+    session = requests.Session()
+    retry = Retry(total=2, read=0, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504), allowed_methods=("GET",))
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=8, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+# Modül süreç başına bir kez yüklenir; oturum ve havuz tüm yeniden çalıştırmalarda paylaşılır
+HTTP_SESSION = make_http_session()
+FETCH_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="f1-fetch")
+# Sonuç, sprint ve sıralama eşitlemeleri aynı anda koşar; her biri FETCH_POOL'a iş
+# gönderip beklediği için ayrı bir havuz kullanılır (iç içe bekleme havuzu tüketmesin)
+SYNC_POOL = ThreadPoolExecutor(max_workers=3, thread_name_prefix="f1-sync")
+
+def fetch_api(url, timeout=DEFAULT_TIMEOUT):
+    with f1Metrics.timed("fetch", url.replace(API_BASE, "").split("?")[0]) as info:
+        try:
+            r = HTTP_SESSION.get(url, timeout=timeout)
+            r.raise_for_status()
+            info.update(ok=True, bytes=len(r.content))
+            return r.json()
+        except:
+            info.update(ok=False)
+            return None
+
+def fetch_many(urls, deadline=FETCH_DEADLINE, timeout=None):
+    """
+    {isim: url} sözlüğündeki tüm uç noktaları aynı anda çeker.
+    Süresi dolan ya da hata veren uç noktalar None döner (kısmi sonuç),
+    böylece yavaş bir uç nokta diğerlerini bekletmez.
+    timeout verilmezse zaman aşımı isimden (ENDPOINT_TIMEOUTS) bulunur.
+    """
+    futures = {name: FETCH_POOL.submit(fetch_api, url, timeout or ENDPOINT_TIMEOUTS.get(name, DEFAULT_TIMEOUT)) for name, url in urls.items()}
+    wait(futures.values(), timeout=deadline)
+    results = {}
+    for name, fut in futures.items():
+        if fut.done():
+            results[name] = fut.result()
+        else:
+            fut.cancel()
+            results[name] = None
+    return results
+
+# --- SONUÇ İSTEMCİSİ: SAYFALI VE SADECE YENİ TURLAR ---
+PAGE_LIMIT = 100       # jolpica sayfa başına en fazla 100 satır döner
+DELTA_MAX_ROUNDS = 3   # Bundan fazla tur eksikse tüm sezon sayfalı çekilir
+RESULT_KEYS = {"results": "Results", "sprint": "SprintResults", "qualifying": "QualifyingResults"}
+
+def session_datetime(date_str, time_str):
+    dt_str = f"{date_str} {time_str or '12:00:00Z'}".replace("Z", "")
+    return datetime.strptime(dt_str, '%Y-%m-%d %H:%M:%S').replace(tzinfo=pytz.utc)
+
+def merge_races(pages, kind):
+    # Sayfa sınırında bölünen yarışların satırlarını aynı turda birleştirir
+    key = RESULT_KEYS[kind]
+    races = {}
+    for page in pages:
+        if not page: continue
+        for race in page['MRData']['RaceTable']['Races']:
+            rnd = int(race['round'])
+            if rnd in races:
+                races[rnd][key].extend(race.get(key, []))
+            else:
+                races[rnd] = race
+    return races
+
+def fetch_pages(url, timeout=DEFAULT_TIMEOUT, deadline=FETCH_DEADLINE):
+    """
+    MRData total/offset alanlarına göre gereken tüm sayfaları paralel çeker.
+    İlk sayfa ve kalan sayfalar birlikte aynı deadline içinde kalır.
+    Herhangi bir sayfa eksik kalırsa None döner; yarım veri depoya yazılmaz.
+    """
+    url = f"{url}?limit={PAGE_LIMIT}"
+    t0 = time.monotonic()
+    first = fetch_many({(url, 0): f"{url}&offset=0"}, deadline, timeout)[(url, 0)]
+    if not first: return None
+    total = int(first['MRData']['total'])
+    remaining = max(0, deadline - (time.monotonic() - t0))
+    rest = fetch_many({(url, offset): f"{url}&offset={offset}" for offset in range(PAGE_LIMIT, total, PAGE_LIMIT)}, remaining, timeout)
+    if any(page is None for page in rest.values()): return None
+    return [first, *rest.values()]
+
+def fetch_season_pages(season, kind):
+    pages = fetch_pages(f"{API_BASE}/{season}/{kind}.json", ENDPOINT_TIMEOUTS.get(kind, DEFAULT_TIMEOUT))
+    return merge_races(pages, kind) if pages else None
+
+def fetch_rounds(season, kind, rounds):
+    urls = {(kind, rnd): f"{API_BASE}/{season}/{rnd}/{kind}.json?limit={PAGE_LIMIT}" for rnd in rounds}
+    pages = fetch_many(urls, timeout=ENDPOINT_TIMEOUTS.get(kind, DEFAULT_TIMEOUT))
+    return merge_races(pages.values(), kind)
+
+def sync_results(season, kind, due_rounds):
+    """
+    Tarihi geçmiş ama depoda olmayan turları çeker, depoya ekler ve
+    sezonun depodaki tüm turlarını {tur: yarış} olarak döner.
+    Normal bir yenilemede en fazla bir yarışın verisi indirilir.
+    """
+    stored = f1Store.read_races(season, kind)
+    missing = [rnd for rnd in due_rounds if rnd not in stored]
+    f1Metrics.cache(f"store:{kind}", not missing, missing=len(missing))
+    if missing:
+        if len(missing) > DELTA_MAX_ROUNDS:
+            fresh = fetch_season_pages(season, kind) or {}
+        else:
+            fresh = fetch_rounds(season, kind, missing)
+        fresh = {rnd: race for rnd, race in fresh.items() if rnd not in stored and race.get(RESULT_KEYS[kind])}
+        if fresh:
+            f1Store.save_races(season, kind, fresh)
+            stored.update(fresh)
+    return stored
+
+# Sezon başına birikmiş istatistik toplamları; süreç açık kaldıkça yalnızca yeni turlar eklenir
+# İlk boyama ve yenileyici aynı anda çalışabilir; "tur eklendi mi" kontrolü ile toplama
+# işlemi tek adımda yapılmazsa aynı tur iki kez sayılır, bu yüzden kilitle korunur.
+STATS_TOTALS = {}
+STATS_LOCK = threading.Lock()
+
+def get_season_stats(season, races_by_kind):
+    with STATS_LOCK:
+        totals = STATS_TOTALS.setdefault(str(season), f1Stats.empty_totals())
+        return f1Stats.season_stats(f1Stats.update_totals(totals, races_by_kind))
+
+def stat_values(stats, entity_id):
+    if len(stats) == 0 or entity_id not in stats.index: return {}
+    row = stats.loc[entity_id]
+    return {
+        "podiums": int(row['podiums']), "dnf": int(row['dnf']), "poles": int(row['poles']),
+        "fastest_laps": int(row['fastest_laps']),
+        "avg_finish": None if pd.isna(row['avg_finish']) else float(row['avg_finish']),
+        "points_per_race": None if pd.isna(row['points_per_race']) else float(row['points_per_race'])
+    }
+
+# --- VERİ ÇEKME: TOP 3 DESTEKLİ ---
+def get_fastf1_winners(season, rounds):
+    """
+    FastF1'den sadece kazananı değil, İLK 3 PİLOTU çeker.
+    Yalnızca verilen (Ergast'ta sonucu olmayan) turlara bakılır; sonuçlar f1Store
+    deposunda kalıcıdır ve depoda olmayan biten turlar yüklenir.
+    """
+    winners = {}
+    try:
+        fastf1 = get_fastf1()
+        schedule = fastf1.get_event_schedule(int(season))
+        completed_races = schedule[(schedule['EventDate'] < datetime.now()) & schedule['RoundNumber'].isin([int(r) for r in rounds])]
+        completed_rounds = list(zip(completed_races['RoundNumber'], completed_races['EventName']))
+        winners, loaded = f1Store.update_podiums(season, completed_rounds)
+        # Sınır denetimi tüm önbellek ağacını gezer; yalnızca yeni seans yüklendiyse yapılır
+        if loaded: f1Cache.enforce_limit()
+    except Exception as e:
+        print(f"FastF1 Hatası: {e}")
+    return winners
+
+def session_entry(name, block, winner=""):
+    # "start" canlı modun seansların ne zaman sürdüğünü bilmesi için UTC başlangıçtır
+    date_str, time_str = block.get('date'), block.get('time')
+    return {
+        "name": name, "time": format_session_time(date_str, time_str), "winner": winner,
+        "start": session_datetime(date_str, time_str) if date_str else None
+    }
+
+def build_calendar(races, ergast_winners, pole_sitters, fallback_winners=None, now=None):
+    """Ergast Race listesinden takvim kartlarının verisini üretir (canlı sezon ve arşiv ortak)."""
+    fallback_winners = fallback_winners or {}
+    now = now or datetime.now(pytz.utc)
+    calendar = []
+    for r in races:
+        round_num = r['round']
+        race_name = r['raceName']
+        circuit = r['Circuit']['circuitName']
+        r_dt = session_datetime(r['date'], r.get('time'))
+        is_past = r_dt < now
+        days_diff = (r_dt - now).days
+
+        # Top 3 Belirle: önce Ergast, yoksa FastF1 / manuel
+        top3 = ergast_winners.get(round_num, None)
+        if (top3 is None) and str(round_num) in fallback_winners:
+            top3 = fallback_winners[str(round_num)]
+        if top3 is None: top3 = []
+
+        pole = pole_sitters.get(round_num, "-")
+
+        # Seanslar
+        sessions = []
+        if 'FirstPractice' in r: sessions.append(session_entry("FP1", r['FirstPractice']))
+        if 'SprintQualifying' in r: sessions.append(session_entry("Sprint Quali", r['SprintQualifying']))
+        elif 'SecondPractice' in r: sessions.append(session_entry("FP2", r['SecondPractice']))
+        if 'Sprint' in r: sessions.append(session_entry("SPRINT", r['Sprint']))
+        elif 'ThirdPractice' in r: sessions.append(session_entry("FP3", r['ThirdPractice']))
+        if 'Qualifying' in r: sessions.append(session_entry("QUALIFYING", r['Qualifying'], pole if is_past else ""))
+        sessions.append(session_entry("RACE", r, top3[0] if top3 else ""))
+
+        calendar.append({
+            "round": round_num,
+            "race": race_name,
+            "circuit": circuit,
+            "date_obj": r_dt,
+            "day": r_dt.day,
+            "month": r_dt.strftime("%b"),
+            "days_left": days_diff,
+            "is_past": is_past,
+            "top3": top3,
+            "sessions": sessions
+        })
+    return calendar
+
+def get_all_data(use_fastf1=True):
+    """
+    Pilotlar, markalar ve takvimi döner. use_fastf1=False ilk boyama içindir:
+    yalnızca Ergast verisi kullanılır, FastF1 hiç yüklenmez.
+    """
+    # Sıralamalar ve takvim tek seferde, paralel çekilir
+    api = fetch_many({
+        "drivers": f"{API_BASE}/current/driverStandings.json",
+        "constructors": f"{API_BASE}/current/constructorStandings.json",
+        "calendar": f"{API_BASE}/current.json"
+    })
+    MANUAL_RESULTS = {}
+
+    # Ergast Results: yalnızca depoda olmayan biten turlar indirilir
+    cal_data = api["calendar"]
+    results, sprints, qualifying = {}, {}, {}
+    driver_stats, constructor_stats = {}, {}
+    if cal_data:
+        season = cal_data['MRData']['RaceTable']['season']
+        now = datetime.now(pytz.utc)
+        race_due, sprint_due, quali_due = [], [], []
+        for r in cal_data['MRData']['RaceTable']['Races']:
+            if session_datetime(r['date'], r.get('time')) < now:
+                race_due.append(int(r['round']))
+            if 'Sprint' in r and session_datetime(r['Sprint'].get('date'), r['Sprint'].get('time')) < now:
+                sprint_due.append(int(r['round']))
+            if 'Qualifying' in r and session_datetime(r['Qualifying'].get('date'), r['Qualifying'].get('time')) < now:
+                quali_due.append(int(r['round']))
+        syncs = {kind: SYNC_POOL.submit(sync_results, season, kind, due)
+                 for kind, due in (("results", race_due), ("sprint", sprint_due), ("qualifying", quali_due))}
+        results, sprints, qualifying = (syncs[kind].result() for kind in ("results", "sprint", "qualifying"))
+        stats = get_season_stats(season, {"results": results, "sprint": sprints, "qualifying": qualifying})
+        driver_stats, constructor_stats = stats["driverId"], stats["constructorId"]
+
+    # 1. PİLOTLAR
+    drivers = []
+    d_data = api["drivers"]
+    if d_data:
+        standings = d_data['MRData']['StandingsTable']['StandingsLists'][0]['DriverStandings']
+        for s in standings:
+            drivers.append({
+                "pos": s['position'],
+                "name": f"{s['Driver']['givenName']} {s['Driver']['familyName'].upper()}",
+                "team": s['Constructors'][0]['name'],
+                "team_id": s['Constructors'][0]['constructorId'],
+                "points": s['points'],
+                "wins": int(s['wins']), "podiums": 0, "dnf": 0,
+                "id": s['Driver']['driverId'],
+                **stat_values(driver_stats, s['Driver']['driverId'])
+            })
+
+    # 2. MARKALAR
+    constructors = []
+    c_data = api["constructors"]
+    if c_data:
+        c_standings = c_data['MRData']['StandingsTable']['StandingsLists'][0]['ConstructorStandings']
+        for c in c_standings:
+            constructors.append({
+                "pos": c['position'], "name": c['Constructor']['name'],
+                "points": c['points'], "wins": c['wins'],
+                "id": c['Constructor']['constructorId'],
+                **stat_values(constructor_stats, c['Constructor']['constructorId'])
+            })
+
+    # 3. TAKVİM
+    calendar = []
+
+    ergast_winners = {}
+    for r in results.values():
+        round_num = r['round']
+        try:
+            top3 = [res['Driver']['code'] for res in r['Results'][:3]]
+            ergast_winners[round_num] = top3
+        except: pass
+
+    pole_sitters = {}
+    for q in qualifying.values():
+        round_num = q['round']
+        try:
+            pole = q['QualifyingResults'][0]['Driver']['code']
+            pole_sitters[round_num] = pole
+        except: pass
+
+    # FastF1 yalnızca Ergast'ta podyumu olmayan biten turlar için devreye girer
+    OFFICIAL_WINNERS = {}
+    if cal_data and use_fastf1:
+        pending = [rnd for rnd in race_due if str(rnd) not in ergast_winners]
+        if pending:
+            OFFICIAL_WINNERS = get_fastf1_winners(season, pending)
+
+    if cal_data:
+        official = {**MANUAL_RESULTS, **OFFICIAL_WINNERS}
+        calendar = build_calendar(cal_data['MRData']['RaceTable']['Races'], ergast_winners, pole_sitters, official)
+    return drivers, constructors, calendar
@@ -0,0 +1,161 @@
+import os
+import time
+import pickle
+import tempfile
+import threading
+from datetime import datetime, timedelta
+import pytz
+import f1Metrics
+
+# --- ARKA PLAN YENİLEYİCİ ---
+# Ergast ve FastF1 verisi sayfa görüntülemesinden bağımsız olarak takvime göre çekilir
+# ve tüm uygulama süreçlerinin okuduğu tek bir anlık görüntü (snapshot) dosyasına yazılır.
+# Okumalar her zaman son sağlam anlık görüntüden yapılır (stale-while-revalidate).
+SNAPSHOT_PATH = os.environ.get("F1_SNAPSHOT_PATH", "f1_snapshot.pkl")
+LOCK_PATH = f"{SNAPSHOT_PATH}.lock"
+SNAPSHOT_SCHEMA = 1
+
+# Yenileme aralıkları (saniye). jolpica saatlik istek sınırı nedeniyle seans
+# sırasında bile 45 sn'nin altına inilmez.
+LIVE_SESSION_INTERVAL = 45
+RACE_WEEKEND_INTERVAL = 120
+PRE_WEEKEND_INTERVAL = 900
+MIDWEEK_INTERVAL = 3600
+RETRY_INTERVAL = 60
+LOCK_RETRY_INTERVAL = 30
+SESSION_LEAD = timedelta(minutes=15)
+SESSION_LENGTH = timedelta(hours=2, minutes=30)
+
+_cache = {"mtime": None, "snapshot": None}
+
+def write_snapshot(data, path=SNAPSHOT_PATH, complete=True):
+    # Geçici dosyaya yazıp os.replace ile değiştirir; okuyucular yarım dosya görmez.
+    # complete=False: FastF1 tamamlaması yapılmamış ilk boyama verisi
+    previous = read_snapshot(path)
+    snapshot = {
+        "schema": SNAPSHOT_SCHEMA,
+        "version": (previous["version"] + 1) if previous else 1,
+        "created": time.time(),
+        "complete": complete,
+        "data": data
+    }
+    # Geçici dosya adı yazıcı başına benzersizdir; aynı süreçteki iş parçacıkları çakışmaz
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or ".", prefix=f"{os.path.basename(path)}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            os.fchmod(f.fileno(), 0o644)  # mkstemp 0600 açar; diğer süreçler de okuyabilmeli
+            pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path): os.remove(tmp_path)
+        raise
+    return snapshot
+
+def read_snapshot(path=SNAPSHOT_PATH):
+    """
+    Son anlık görüntüyü döner. Dosya değişmediyse bellekteki kopya kullanılır,
+    yani sayfa yüklemesi yalnızca bir os.stat maliyetindedir.
+    """
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+    if _cache["mtime"] == mtime and _cache.get("path") == path:
+        f1Metrics.cache("snapshot", True)
+        return _cache["snapshot"]
+    f1Metrics.cache("snapshot", False)
+    try:
+        with open(path, "rb") as f:
+            snapshot = pickle.load(f)
+    except Exception as e:
+        print(f"Anlık görüntü okunamadı: {e}")
+        return _cache["snapshot"]
+    if snapshot.get("schema") != SNAPSHOT_SCHEMA:
+        return None
+    _cache.update(mtime=mtime, snapshot=snapshot, path=path)
+    return snapshot
+
+def is_good(data):
+    drivers, constructors, calendar = data
+    return bool(drivers and constructors and calendar)
+
+def weekend_race(calendar, now=None):
+    """Şu an içinde bulunulan yarış haftasonunun takvim kaydını, yoksa None döner."""
+    now = now or datetime.now(pytz.utc)
+    for race in calendar or []:
+        race_dt = race['date_obj']
+        if race_dt - timedelta(days=3) <= now <= race_dt + timedelta(hours=4):
+            return race
+    return None
+
+def session_running(race, now=None):
+    # Seans başlangıcından biraz önce ile bitişinden biraz sonrası arası "canlı" sayılır
+    now = now or datetime.now(pytz.utc)
+    for sess in race['sessions'] if race else []:
+        start = sess.get('start')
+        if start and start - SESSION_LEAD <= now <= start + SESSION_LENGTH:
+            return True
+    return False
+
+def next_interval(calendar, now=None):
+    # Seans sırasında çok sık, yarış haftasonunda sık, haftasonuna yakın orta, hafta içinde seyrek yenile
+    now = now or datetime.now(pytz.utc)
+    race = weekend_race(calendar, now)
+    if race is not None:
+        return LIVE_SESSION_INTERVAL if session_running(race, now) else RACE_WEEKEND_INTERVAL
+    for race in calendar or []:
+        if now < race['date_obj'] - timedelta(days=3) <= now + timedelta(days=2):
+            return PRE_WEEKEND_INTERVAL
+    return MIDWEEK_INTERVAL
+
+def refresh_once(path=SNAPSHOT_PATH):
+    import f1Data
+    data = f1Data.get_all_data()
+    if is_good(data):
+        write_snapshot(data, path)
+        return data
+    # Eksik veriyle son sağlam anlık görüntünün üzerine yazılmaz
+    print("Yenileme eksik veri döndü, önceki anlık görüntü korunuyor")
+    return None
+
+def acquire_lock(path=LOCK_PATH):
+    # Aynı anda yalnızca bir süreç yenileyici olur; diğerleri sadece okur
+    import fcntl
+    handle = open(path, "w")
+    try:
+        fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        handle.close()
+        return None
+    return handle
+
+def run_forever(path=SNAPSHOT_PATH):
+    # Kilit başka süreçteyse beklemede kalınır; o süreç kapanırsa yenileyicilik devralınır
+    lock = acquire_lock(f"{path}.lock")
+    if lock is None:
+        print("Başka bir yenileyici çalışıyor, beklemede")
+    while lock is None:
+        time.sleep(LOCK_RETRY_INTERVAL)
+        lock = acquire_lock(f"{path}.lock")
+    snapshot = read_snapshot(path)
+    if snapshot and snapshot.get("complete", True) and time.time() - snapshot["created"] < next_interval(snapshot["data"][2]):
+        time.sleep(next_interval(snapshot["data"][2]) - (time.time() - snapshot["created"]))
+    while True:
+        try:
+            data = refresh_once(path)
+        except Exception as e:
+            print(f"Yenileme Hatası: {e}")
+            data = None
+        if data is None:
+            time.sleep(RETRY_INTERVAL)
+        else:
+            time.sleep(next_interval(data[2]))
+
+def start_background_refresher(path=SNAPSHOT_PATH):
+    thread = threading.Thread(target=run_forever, args=(path,), name="f1-ingest", daemon=True)
+    thread.start()
+    return thread
+
+if __name__ == "__main__":
+    # Kullanım: python f1Ingest.py  (ayrı bir süreç olarak sürekli çalışır)
+    run_forever()
@@ -0,0 +1,106 @@
+import os
+import sys
+import time
+import pickle
+import argparse
+from datetime import datetime
+import pytz
+import f1Ingest
+
+# --- CANLI YARIŞ HAFTASONU MODU ---
+# Takvimdeki bir haftasonunun içindeyken uygulama akışı kısa aralıklarla yoklar,
+# yeni veriyi öncekiyle karşılaştırır ve yalnızca değişen sekme/kartları yeniden çizer.
+# Akış F1_LIVE_FEED ile seçilir:
+#   "snapshot"          -> arka plan yenileyicinin anlık görüntüsü (varsayılan)
+#   "replay:<dosya>"    -> kayıtlı bir seansın yerel tekrarı (test için)
+LIVE_FEED = os.environ.get("F1_LIVE_FEED", "snapshot")
+REPLAY_SPEED = float(os.environ.get("F1_REPLAY_SPEED", "1"))
+# Yoklama aralıkları (saniye): anlık görüntüyü okumak ucuzdur, ağ çağrısı yapılmaz
+SESSION_POLL_INTERVAL = 10
+WEEKEND_POLL_INTERVAL = 60
+
+def snapshot_feed():
+    snapshot = f1Ingest.read_snapshot()
+    return snapshot["data"] if snapshot else None
+
+class ReplayFeed:
+    """
+    Kayıtlı çerçeveleri [{"t": saniye, "data": (drivers, constructors, calendar)}, ...]
+    ilk yoklamadan itibaren geçen süreye göre (speed katıyla) sırayla oynatır.
+    """
+    def __init__(self, path, speed=REPLAY_SPEED):
+        with open(path, "rb") as f:
+            self.frames = sorted(pickle.load(f), key=lambda frame: frame["t"])
+        self.speed = speed
+        self.started = None
+
+    def __call__(self):
+        if not self.frames: return None
+        if self.started is None: self.started = time.monotonic()
+        elapsed = (time.monotonic() - self.started) * self.speed
+        current = self.frames[0]
+        for frame in self.frames:
+            if frame["t"] > elapsed: break
+            current = frame
+        return current["data"]
+
+def make_feed(spec=LIVE_FEED):
+    if spec.startswith("replay:"):
+        return ReplayFeed(spec.split(":", 1)[1])
+    return snapshot_feed
+
+def is_replay(spec=LIVE_FEED):
+    return spec.startswith("replay:")
+
+def is_live(calendar, now=None, spec=LIVE_FEED):
+    # Tekrar akışı her zaman canlı modu açar; aksi halde takvimdeki haftasonuna bakılır
+    return is_replay(spec) or f1Ingest.weekend_race(calendar, now) is not None
+
+def poll_interval(calendar, now=None, spec=LIVE_FEED):
+    now = now or datetime.now(pytz.utc)
+    if is_replay(spec) or f1Ingest.session_running(f1Ingest.weekend_race(calendar, now), now):
+        return SESSION_POLL_INTERVAL
+    return WEEKEND_POLL_INTERVAL
+
+def diff_data(old, new):
+    """
+    İki (drivers, constructors, calendar) verisini karşılaştırır:
+    {"drivers": bool, "constructors": bool, "calendar": {değişen tur numaraları}}
+    """
+    if old is None:
+        return {"drivers": True, "constructors": True, "calendar": {r['round'] for r in new[2]}}
+    old_races = {r['round']: r for r in old[2]}
+    return {
+        "drivers": old[0] != new[0],
+        "constructors": old[1] != new[1],
+        "calendar": {r['round'] for r in new[2] if old_races.get(r['round']) != r} | (set(old_races) - {r['round'] for r in new[2]})
+    }
+
+def record(out_path, interval, duration, feed=snapshot_feed):
+    # Canlı bir seansı sonraki tekrarlar için kaydeder; yalnızca değişen çerçeveler yazılır
+    frames, last, started = [], None, time.monotonic()
+    while time.monotonic() - started < duration:
+        data = feed()
+        if data is not None and data != last:
+            frames.append({"t": round(time.monotonic() - started, 1), "data": data})
+            last = data
+            with open(f"{out_path}.tmp", "wb") as f:
+                pickle.dump(frames, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(f"{out_path}.tmp", out_path)
+            print(f"{frames[-1]['t']:.0f} s: çerçeve {len(frames)}")
+        time.sleep(interval)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Canlı mod akış kaydedici")
+    sub = parser.add_subparsers(dest="command", required=True)
+    p_record = sub.add_parser("record", help="Anlık görüntü akışını tekrar dosyasına kaydeder")
+    p_record.add_argument("--out", default="replay.pkl")
+    p_record.add_argument("--interval", type=float, default=SESSION_POLL_INTERVAL)
+    p_record.add_argument("--duration", type=float, default=3 * 3600)
+    args = parser.parse_args(argv)
+
+    if args.command == "record":
+        record(args.out, args.interval, args.duration)
+
+if __name__ == "__main__":
+    sys.exit(main())
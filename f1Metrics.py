@@ -0,0 +1,67 @@
+import os
+import json
+import time
+import threading
+from collections import deque
+from contextlib import contextmanager
+
+# --- ÖLÇÜM KANCASI ---
+# Veri katmanı her ağ isteğini, önbellek isabet/ıskalamasını ve FastF1 yükleme süresini
+# buraya bildirir. Olaylar bellekte sınırlı bir halkada tutulur (hata ayıklama paneli
+# için) ve F1_METRICS_LOG verilmişse JSON satırları olarak dosyaya da yazılır.
+METRICS_LOG = os.environ.get("F1_METRICS_LOG")
+MAX_EVENTS = 2000
+
+_events = deque(maxlen=MAX_EVENTS)
+_lock = threading.Lock()
+
+def record(kind, name, seconds=None, **extra):
+    """kind: "fetch", "cache" ya da "fastf1"; cache olaylarında extra["hit"] bulunur."""
+    event = {"ts": time.time(), "kind": kind, "name": name, **extra}
+    if seconds is not None: event["ms"] = round(seconds * 1000, 2)
+    with _lock:
+        _events.append(event)
+        if METRICS_LOG:
+            with open(METRICS_LOG, "a", encoding="utf-8") as f:
+                f.write(json.dumps(event, default=str) + "\n")
+
+def cache(name, hit, **extra):
+    record("cache", name, hit=bool(hit), **extra)
+
+@contextmanager
+def timed(kind, name, **extra):
+    t0 = time.perf_counter()
+    try:
+        yield extra
+    finally:
+        record(kind, name, time.perf_counter() - t0, **extra)
+
+def events(kind=None):
+    with _lock:
+        return [e for e in _events if kind is None or e["kind"] == kind]
+
+def clear():
+    with _lock:
+        _events.clear()
+
+def percentile(values, q):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))] if ordered else None
+
+def summary():
+    """(tür, ad) başına sayı, ortalama/p95 süre ve önbellek isabet oranı."""
+    groups = {}
+    for e in events():
+        groups.setdefault((e["kind"], e["name"]), []).append(e)
+    rows = []
+    for (kind, name), group in sorted(groups.items()):
+        times = [e["ms"] for e in group if "ms" in e]
+        hits = [e["hit"] for e in group if "hit" in e]
+        rows.append({
+            "kind": kind, "name": name, "count": len(group),
+            "mean_ms": round(sum(times) / len(times), 2) if times else None,
+            "p95_ms": percentile(times, 0.95),
+            "hit_rate": round(sum(hits) / len(hits), 2) if hits else None,
+            "errors": sum(1 for e in group if e.get("ok") is False)
+        })
+    return rows
@@ -0,0 +1,135 @@
+from typing import NamedTuple
+
+# --- VARLIK KAYDI ---
+# Pilot ve takımlar başlangıçta bir kez; Ergast driverId / pilot kodu / constructorId ve
+# sezona bağlı takma adlarla dizinlenir. Aramalar O(1) sözlük erişimidir ve sonuç
+# anahtar başına hatırlanır. Eşleşmeyen varlıklar sessizce geçilmez, raporlanır.
+PORTRAIT_BASE = "https://media.formula1.com/d_driver_fallback_image.png/content/dam/fom-website/drivers"
+FALLBACK_PORTRAIT = f"{PORTRAIT_BASE}/driver_fallback_image.png"
+FALLBACK_LOGO = "https://upload.wikimedia.org/wikipedia/commons/thumb/5/53/F1_chequered_flag.svg/100px-F1_chequered_flag.svg.png"
+FALLBACK_COLOR = "#333"
+
+# driverId: (kod, portre yolu)
+DRIVERS = {
+    "max_verstappen": ("VER", "M/MAXVER01_Max_Verstappen/maxver01.png"),
+    "perez": ("PER", "S/SERPER01_Sergio_Perez/serper01.png"),
+    "hamilton": ("HAM", "L/LEWHAM01_Lewis_Hamilton/lewham01.png"),
+    "russell": ("RUS", "G/GEORUS01_George_Russell/georus01.png"),
+    "leclerc": ("LEC", "C/CHALEC01_Charles_Leclerc/chalec01.png"),
+    "sainz": ("SAI", "C/CARSAI01_Carlos_Sainz/carsai01.png"),
+    "norris": ("NOR", "L/LANNOR01_Lando_Norris/lannor01.png"),
+    "piastri": ("PIA", "O/OSCPIA01_Oscar_Piastri/oscpia01.png"),
+    "alonso": ("ALO", "F/FERALO01_Fernando_Alonso/feralo01.png"),
+    "stroll": ("STR", "L/LANSTR01_Lance_Stroll/lanstr01.png"),
+    "gasly": ("GAS", "P/PIEGAS01_Pierre_Gasly/piegas01.png"),
+    "ocon": ("OCO", "E/ESTOCO01_Esteban_Ocon/estoco01.png"),
+    "albon": ("ALB", "A/ALEALB01_Alexander_Albon/alealb01.png"),
+    "tsunoda": ("TSU", "Y/YUKTSU01_Yuki_Tsunoda/yuktsu01.png"),
+    "hulkenberg": ("HUL", "N/NICHUL01_Nico_Hulkenberg/nichul01.png"),
+    "bottas": ("BOT", "V/VALBOT01_Valtteri_Bottas/valbot01.png"),
+    "zhou": ("ZHO", "G/GUAZHO01_Guanyu_Zhou/guazho01.png"),
+    "kevin_magnussen": ("MAG", "K/KEVMAG01_Kevin_Magnussen/kevmag01.png"),
+    "colapinto": ("COL", "F/FRACOL01_Franco_Colapinto/fracol01.png"),
+    "bearman": ("BEA", "O/OLIBEA01_Oliver_Bearman/olibea01.png"),
+    "lawson": ("LAW", "L/LIALAW01_Liam_Lawson/lialaw01.png")
+}
+
+# constructorId: (görünen ad, renk, logo dosyası ya da URL)
+TEAMS = {
+    "red_bull": ("Red Bull", "#3671C6", "rblogo.png"),
+    "mercedes": ("Mercedes", "#27F4D2", "merclogo.png"),
+    "ferrari": ("Ferrari", "#E80020", "ferrari.png"),
+    "mclaren": ("McLaren", "#FF8000", "mclarenlogo.png"),
+    "aston_martin": ("Aston Martin", "#229971", "astonlogo.png"),
+    "alpine": ("Alpine", "#0093CC", "alpinelogo.png"),
+    "williams": ("Williams", "#64C4FF", "williamslogo.png"),
+    "rb": ("RB", "#6692FF", "racingblogo.png"),
+    "sauber": ("Sauber", "#52E252", "kicklogo.png"),
+    "haas": ("Haas", "#B6BABD", "https://upload.wikimedia.org/wikipedia/commons/thumb/d/d4/Logo_Haas_F1.png/100px-Logo_Haas_F1.png")
+}
+
+# (takma ad, constructorId, ilk sezon, son sezon): Ergast'ın farklı yıllardaki id ve adları
+TEAM_ALIASES = [
+    ("Red Bull Racing", "red_bull", 2005, None),
+    ("Haas F1 Team", "haas", 2016, None),
+    ("Alpine F1 Team", "alpine", 2021, None),
+    ("RB F1 Team", "rb", 2024, None),
+    ("Racing Bulls", "rb", 2025, None),
+    ("alphatauri", "rb", 2020, 2023), ("AlphaTauri", "rb", 2020, 2023),
+    ("toro_rosso", "rb", 2006, 2019), ("Toro Rosso", "rb", 2006, 2019),
+    ("Kick Sauber", "sauber", 2024, None),
+    ("alfa", "sauber", 2019, 2023), ("Alfa Romeo", "sauber", 2019, 2023),
+    ("renault", "alpine", 2016, 2020), ("Renault", "alpine", 2016, 2020),
+    ("racing_point", "aston_martin", 2019, 2020), ("Racing Point", "aston_martin", 2019, 2020),
+    ("force_india", "aston_martin", 2008, 2018), ("Force India", "aston_martin", 2008, 2018)
+]
+
+class DriverRecord(NamedTuple):
+    driver_id: str
+    code: str
+    portrait: str
+
+class TeamRecord(NamedTuple):
+    constructor_id: str
+    name: str
+    color: str
+    logo: str
+
+def normalize(key):
+    return str(key).strip().lower().replace(" ", "_").replace("-", "_")
+
+class Registry:
+    def __init__(self, logo_loader=None):
+        # logo_loader: yerel logo dosyasını data URI'ye çeviren fonksiyon (ör. get_local_img)
+        load = logo_loader or (lambda path: path)
+        self.drivers = {}
+        for driver_id, (code, path) in DRIVERS.items():
+            record = DriverRecord(driver_id, code, f"{PORTRAIT_BASE}/{path}")
+            self.drivers[normalize(driver_id)] = record
+            self.drivers[normalize(code)] = record
+        self.teams = {}
+        for constructor_id, (name, color, logo) in TEAMS.items():
+            record = TeamRecord(constructor_id, name, color, logo if logo.startswith("http") else load(logo))
+            self.teams[normalize(constructor_id)] = record
+            self.teams[normalize(name)] = record
+        self.team_aliases = {}
+        for alias, constructor_id, first, last in TEAM_ALIASES:
+            self.team_aliases.setdefault(normalize(alias), []).append((first, last, self.teams[constructor_id]))
+        self.memo = {}
+        self.unmatched = set()
+
+    def miss(self, kind, key, season):
+        if (kind, key) not in self.unmatched:
+            self.unmatched.add((kind, key))
+            print(f"Kayıtta eşleşme yok: {kind} '{key}'" + (f" ({season})" if season else ""))
+        return None
+
+    def driver(self, key, season=None):
+        memo_key = ("driver", key, season)
+        if memo_key not in self.memo:
+            self.memo[memo_key] = self.drivers.get(normalize(key)) or self.miss("driver", key, season)
+        return self.memo[memo_key]
+
+    def team(self, key, season=None):
+        memo_key = ("team", key, season)
+        if memo_key not in self.memo:
+            norm = normalize(key)
+            record = self.teams.get(norm)
+            if record is None:
+                season = int(season) if season else None
+                record = next((rec for first, last, rec in self.team_aliases.get(norm, [])
+                               if season is None or (first <= season and (last is None or season <= last))), None)
+            self.memo[memo_key] = record or self.miss("team", key, season)
+        return self.memo[memo_key]
+
+    def portrait_of(self, driver_id, season=None):
+        record = self.driver(driver_id, season)
+        return record.portrait if record else FALLBACK_PORTRAIT
+
+    def color_of(self, team, season=None):
+        record = self.team(team, season)
+        return record.color if record else FALLBACK_COLOR
+
+    def logo_of(self, team, season=None):
+        record = self.team(team, season)
+        return record.logo if record else FALLBACK_LOGO
@@ -0,0 +1,113 @@
+# --- HTML OLUŞTURUCU ---
+# Streamlit'ten bağımsız düz fonksiyonlar: her sekmenin tüm HTML'i tek geçişte
+# üretilir ve tek bir st.markdown öğesi olarak gönderilir. Şablonlar tek satırdır;
+# Markdown boş satır ya da girinti görürse HTML bloğunu koparır.
+
+STAT_BOX = '<div class="stat-box"><div class="stat-val"{style}>{value}</div><div class="stat-lbl">{label}</div></div>'.format
+STATS_ROW = '<div class="stats-row">{0}</div>'.format
+
+DRIVER_CARD = (
+    '<details style="margin-bottom: 5px;"><summary class="card-row" style="border-left-color: {color};">'
+    '<div class="pos-num">{pos}</div><img src="{img}" class="avatar">'
+    '<div class="info-box"><div class="main-name">{name}</div><div class="sub-name">{team}</div></div>'
+    '<div class="points-box"><div class="pts-val">{points}</div><div class="pts-lbl">PTS</div></div></summary>'
+    '<div class="details-panel">{stats}</div></details>'
+).format
+
+CONSTRUCTOR_CARD = (
+    '<details style="margin-bottom: 5px;"><summary class="card-row" style="border-left-color: {color};"><div class="pos-num">{pos}</div>'
+    '<img src="{logo}" class="avatar" style="border-radius: 5px; width: 60px; object-fit: contain; background: transparent; border: none;">'
+    '<div class="info-box"><div class="main-name">{name}</div><div class="sub-name">{wins} Galibiyet</div></div>'
+    '<div class="points-box"><div class="pts-val">{points}</div><div class="pts-lbl">PTS</div></div></summary>'
+    '<div class="details-panel">{stats}</div></details>'
+).format
+
+RACE_CARD = (
+    '<details name="f1-race" style="margin-bottom: 8px;">'
+    '<summary class="calendar-card" style="display: flex; align-items: center; background-color: #121214; border-radius: 8px; padding: 15px; border-left: 5px solid {border_color}; cursor: pointer;">'
+    '<div class="cal-date"><div class="cal-day">{day}</div><div class="cal-month">{month}</div></div>'
+    '<div class="cal-info" style="flex-grow: 1;"><div class="cal-race">{race}</div><div class="cal-circuit">{circuit}</div></div>'
+    '<div class="cal-badge">{badge}</div></summary>'
+    '<div class="details-panel">{sessions}</div></details>'
+).format
+
+SESSION_ROW = (
+    '<div class="session-row"><div class="sess-name">{name}</div><div class="sess-time">{time}</div>'
+    '<div class="sess-result">{winner}</div></div>'
+).format
+
+BADGE_PODIUM = (
+    '<div class="badge-val p1">1. {0}</div>'
+    '<div class="badge-val p2">2. {1}</div>'
+    '<div class="badge-val p3">3. {2}</div>'
+).format
+BADGE_WINNER = '<div class="badge-val p1">1. {0}</div>'.format
+BADGE_PENDING = '<div class="badge-lbl">SONUÇ BEKLENİYOR</div>'
+BADGE_NEXT = '<div class="badge-val" style="color:#FF1801;">{0}</div><div class="badge-lbl">GÜN KALDI</div>'.format
+BADGE_DAYS = '<div class="badge-val">{0}</div><div class="badge-lbl">GÜN</div>'.format
+
+def stat_box(value, label, color=None):
+    return STAT_BOX(value=value, label=label, style=f' style="color:{color};"' if color else "")
+
+def fmt_stat(value, digits=1):
+    return "-" if value is None else f"{value:.{digits}f}"
+
+def detail_stats(row):
+    # Sonuç, pole, en hızlı tur ve ortalama istatistikleri; arşiv sezonlarında eksik olabilir
+    return STATS_ROW(
+        stat_box(row['wins'], "Galibiyet", "#ffd700") + stat_box(row.get('podiums', 0), "Podyum", "#c0c0c0")
+        + stat_box(row.get('dnf', 0), "DNF", "#ff4d4d")
+    ) + STATS_ROW(
+        stat_box(row.get('poles', 0), "Pole") + stat_box(row.get('fastest_laps', 0), "En Hızlı Tur")
+        + stat_box(fmt_stat(row.get('avg_finish')), "Ort. Bitiş") + stat_box(fmt_stat(row.get('points_per_race')), "Puan/Yarış")
+    )
+
+def render_drivers(drivers, color_of, img_of):
+    return "".join(
+        DRIVER_CARD(color=color_of(d.get('team_id', d['team'])), img=img_of(d['id']), pos=d['pos'], name=d['name'], team=d['team'],
+                    points=d['points'], stats=detail_stats(d))
+        for d in drivers
+    )
+
+def render_constructors(constructors, color_of, logo_of):
+    return "".join(
+        CONSTRUCTOR_CARD(color=color_of(c.get('id', c['name'])), logo=logo_of(c.get('id', c['name'])), pos=c['pos'], name=c['name'],
+                         wins=c['wins'], points=c['points'], stats=detail_stats(c))
+        for c in constructors
+    )
+
+def race_badge(race, is_next):
+    top3 = race['top3']
+    if race['is_past']:
+        if top3 and len(top3) >= 3: return BADGE_PODIUM(*top3)
+        if top3: return BADGE_WINNER(top3[0])
+        return BADGE_PENDING
+    if is_next: return BADGE_NEXT(max(race['days_left'], 0))
+    return BADGE_DAYS(race['days_left'])
+
+def render_race(race, is_next):
+    sessions = "".join(SESSION_ROW(name=s['name'], time=s['time'], winner=s['winner']) for s in race['sessions'])
+    return RACE_CARD(border_color="#FF1801" if is_next else "#333", day=race['day'], month=race['month'],
+                     race=race['race'], circuit=race['circuit'], badge=race_badge(race, is_next), sessions=sessions)
+
+def next_race_index(calendar):
+    return next((i for i, r in enumerate(calendar) if not r['is_past']), -1)
+
+def render_calendar(calendar):
+    next_idx = next_race_index(calendar)
+    return "".join(render_race(race, idx == next_idx) for idx, race in enumerate(calendar))
+
+def render_calendar_cached(calendar, cache):
+    """
+    Canlı mod için: cache {tur: (yarış, sıradaki mi, html)} sözlüğünde değişmeyen
+    kartların HTML'i yeniden kullanılır, yalnızca değişen kartlar yeniden oluşturulur.
+    """
+    next_idx = next_race_index(calendar)
+    parts = []
+    for idx, race in enumerate(calendar):
+        is_next = idx == next_idx
+        cached = cache.get(race['round'])
+        if cached is None or cached[0] != race or cached[1] != is_next:
+            cached = cache[race['round']] = (race, is_next, render_race(race, is_next))
+        parts.append(cached[2])
+    return "".join(parts)
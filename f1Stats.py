@@ -0,0 +1,92 @@
+import pandas as pd
+
+# --- İSTATİSTİK MOTORU ---
+# Sezonun tüm yarış, sprint ve sıralama sonuçları tek bir DataFrame'e yüklenir;
+# pilot ve takım istatistikleri groupby ile tek seferde hesaplanır.
+# Toplamlar toplanabilir tutulur, böylece yeni bir tur geldiğinde yalnızca o tur eklenir.
+# Ergast positionText: R = yarış dışı, N = klasmana girmedi, D = diskalifiye,
+# E = hariç tutuldu, W = çekildi, F = yarışa kalifiye olamadı. Bunlar bitiriş
+# sayılmaz; ortalama bitiş sırasına girmez, DNF olarak sayılır.
+DNF_CODES = ("R", "N", "D", "E", "W", "F")
+ENTITY_KEYS = ("driverId", "constructorId")
+RESULT_COLUMNS = ["round", "kind", "driverId", "code", "constructorId", "position", "positionText", "points", "fastest"]
+TOTAL_COLUMNS = ["races", "wins", "podiums", "dnf", "poles", "fastest_laps", "points", "finish_sum", "finish_count"]
+
+def driver_code(driver):
+    # Eski sezonlarda Ergast pilot kodu vermez; soyadının ilk üç harfi kullanılır
+    return driver.get('code') or driver['familyName'][:3].upper()
+
+def results_frame(races, kind):
+    """{tur: Ergast Race} sözlüğünü satır başına bir sonuç olan DataFrame'e çevirir."""
+    key = {"results": "Results", "sprint": "SprintResults", "qualifying": "QualifyingResults"}[kind]
+    rows = [
+        {
+            "round": int(race['round']), "kind": kind,
+            "driverId": res['Driver']['driverId'], "code": driver_code(res['Driver']),
+            "constructorId": res['Constructor']['constructorId'],
+            "position": int(res['position']), "positionText": res.get('positionText', res['position']),
+            "points": float(res.get('points', 0)),
+            "fastest": res.get('FastestLap', {}).get('rank') == "1"
+        }
+        for race in races.values() for res in race.get(key, [])
+    ]
+    return pd.DataFrame(rows, columns=RESULT_COLUMNS)
+
+def aggregate(frame, key):
+    # Yalnızca toplanabilir sütunlar; ortalamalar finalize() içinde türetilir
+    race = frame['kind'] == "results"
+    classified = race & ~frame['positionText'].isin(DNF_CODES)
+    flags = pd.DataFrame({
+        key: frame[key],
+        "round": frame['round'].where(race),
+        "wins": (race & (frame['position'] == 1)).astype(int),
+        "podiums": (race & (frame['position'] <= 3)).astype(int),
+        "dnf": (race & frame['positionText'].isin(DNF_CODES)).astype(int),
+        "poles": ((frame['kind'] == "qualifying") & (frame['position'] == 1)).astype(int),
+        "fastest_laps": (race & frame['fastest']).astype(int),
+        "points": frame['points'].where(frame['kind'] != "qualifying", 0.0),
+        "finish_sum": frame['position'].where(classified, 0),
+        "finish_count": classified.astype(int)
+    })
+    totals = flags.groupby(key).agg(
+        races=("round", "nunique"), wins=("wins", "sum"), podiums=("podiums", "sum"), dnf=("dnf", "sum"),
+        poles=("poles", "sum"), fastest_laps=("fastest_laps", "sum"), points=("points", "sum"),
+        finish_sum=("finish_sum", "sum"), finish_count=("finish_count", "sum")
+    )
+    return totals[TOTAL_COLUMNS]
+
+def empty_totals():
+    return {"rounds": set(), **{key: pd.DataFrame(columns=TOTAL_COLUMNS, dtype=float).rename_axis(key) for key in ENTITY_KEYS}}
+
+def update_totals(totals, races_by_kind):
+    """
+    races_by_kind: {"results": {...}, "sprint": {...}, "qualifying": {...}}
+    Toplamlara henüz eklenmemiş (tür, tur) çiftlerini ekler; ilk çağrıda tüm sezonu işler.
+    """
+    frames = []
+    for kind, races in races_by_kind.items():
+        fresh = {rnd: race for rnd, race in races.items() if (kind, int(rnd)) not in totals["rounds"]}
+        if fresh:
+            frames.append(results_frame(fresh, kind))
+            totals["rounds"].update((kind, int(rnd)) for rnd in fresh)
+    if frames:
+        frame = pd.concat(frames, ignore_index=True)
+        for key in ENTITY_KEYS:
+            totals[key] = totals[key].add(aggregate(frame, key), fill_value=0)
+    return totals
+
+def finalize(totals):
+    stats = totals.astype(float)
+    stats["avg_finish"] = (stats["finish_sum"] / stats["finish_count"].where(stats["finish_count"] > 0)).round(1)
+    stats["points_per_race"] = (stats["points"] / stats["races"].where(stats["races"] > 0)).round(2)
+    counts = ["races", "wins", "podiums", "dnf", "poles", "fastest_laps", "finish_count"]
+    stats[counts] = stats[counts].fillna(0).astype(int)
+    return stats.drop(columns=["finish_sum", "finish_count"])
+
+def stats_from_frame(frame):
+    # Arşivden okunan hazır sonuç tablosu için tek seferlik hesap
+    return {key: finalize(aggregate(frame, key)) for key in ENTITY_KEYS}
+
+def season_stats(totals):
+    """Arayüzün okuduğu sonuç: {"driverId": DataFrame, "constructorId": DataFrame}"""
+    return {key: finalize(totals[key]) for key in ENTITY_KEYS}
@@ -0,0 +1,107 @@
+import os
+import json
+import sqlite3
+import time
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+import f1Metrics
+
+# --- YARIŞ SONUÇ DEPOSU ---
+# Biten bir yarışın sonucu bir daha değişmez; (sezon, tur) anahtarıyla
+# bir kez yazılır ve bir daha FastF1'den yüklenmez.
+STORE_PATH = os.environ.get("F1_STORE_PATH", "f1_store.db")
+MAX_LOAD_WORKERS = 4
+# Yükleme arka plan yenileyicisinin iş parçacığından, çok iş parçacıklı Streamlit
+# sunucusunun içinden başlar; fork başka iş parçacıklarının tuttuğu kilitleri
+# kopyalayıp çocuğu kilitleyebileceği için işçiler forkserver ile başlatılır.
+LOAD_CONTEXT = multiprocessing.get_context("forkserver")
+
+def connect(path=STORE_PATH):
+    con = sqlite3.connect(path, timeout=30)
+    con.execute("""
+        CREATE TABLE IF NOT EXISTS podiums (
+            season INTEGER NOT NULL,
+            round INTEGER NOT NULL,
+            top3 TEXT NOT NULL,
+            PRIMARY KEY (season, round)
+        )
+    """)
+    con.execute("""
+        CREATE TABLE IF NOT EXISTS races (
+            season INTEGER NOT NULL,
+            round INTEGER NOT NULL,
+            kind TEXT NOT NULL,
+            race TEXT NOT NULL,
+            PRIMARY KEY (season, round, kind)
+        )
+    """)
+    return con
+
+def read_races(season, kind, path=STORE_PATH):
+    # kind: "results" ya da "qualifying"; değer Ergast'ın Race nesnesidir
+    with connect(path) as con:
+        rows = con.execute("SELECT round, race FROM races WHERE season = ? AND kind = ? ORDER BY round", (int(season), kind)).fetchall()
+    return {rnd: json.loads(race) for rnd, race in rows}
+
+def save_races(season, kind, races, path=STORE_PATH):
+    with connect(path) as con:
+        con.executemany(
+            "INSERT OR REPLACE INTO races (season, round, kind, race) VALUES (?, ?, ?, ?)",
+            [(int(season), int(rnd), kind, json.dumps(race)) for rnd, race in races.items()]
+        )
+
+def read_podiums(season, path=STORE_PATH):
+    with connect(path) as con:
+        rows = con.execute("SELECT round, top3 FROM podiums WHERE season = ?", (int(season),)).fetchall()
+    return {str(rnd): json.loads(top3) for rnd, top3 in rows}
+
+def save_podiums(season, podiums, path=STORE_PATH):
+    with connect(path) as con:
+        con.executemany(
+            "INSERT OR REPLACE INTO podiums (season, round, top3) VALUES (?, ?, ?)",
+            [(int(season), int(rnd), json.dumps(top3)) for rnd, top3 in podiums.items()]
+        )
+
+def load_podium(season, round_num, event_name):
+    # Ayrı süreçte çalışır; her süreç FastF1 önbelleğini kendisi açar
+    # Süre ana sürece geri döner; ölçüm olayları işçi süreçte kaybolmasın diye orada kaydedilir
+    import fastf1
+    import f1Cache
+    f1Cache.enable_cache(fastf1)
+    t0 = time.perf_counter()
+    try:
+        session = fastf1.get_session(season, event_name, 'R')
+        session.load(laps=False, telemetry=False, weather=False, messages=False)
+        f1Cache.touch_session(session)
+        top3 = session.results.iloc[:3]['Abbreviation'].tolist()
+        return round_num, top3 if len(top3) == 3 else None, time.perf_counter() - t0
+    except:
+        return round_num, None, time.perf_counter() - t0
+
+# Turları yükleyen fonksiyon; ölçüm düzeneği (f1Bench) sahte bir FastF1 kaynağıyla değiştirir
+PODIUM_LOADER = load_podium
+
+def update_podiums(season, completed_rounds, path=STORE_PATH, workers=MAX_LOAD_WORKERS):
+    """
+    completed_rounds: [(tur, etkinlik adı), ...]
+    Depoda olmayan biten turları süreç havuzunda paralel yükler,
+    sonuçları depoya yazar ve (sezonun tüm podyumları, FastF1'den yükleme yapıldı mı) döner.
+    """
+    known = read_podiums(season, path)
+    missing = [(int(rnd), name) for rnd, name in completed_rounds if str(int(rnd)) not in known]
+    f1Metrics.cache("store:podiums", not missing, missing=len(missing))
+    if missing:
+        fresh = {}
+        if len(missing) == 1:
+            results = [PODIUM_LOADER(season, *missing[0])]
+        else:
+            with ProcessPoolExecutor(max_workers=min(workers, len(missing)), mp_context=LOAD_CONTEXT) as pool:
+                results = list(pool.map(PODIUM_LOADER, [season] * len(missing), *zip(*missing)))
+        for rnd, top3, seconds in results:
+            f1Metrics.record("fastf1", "session.load", seconds, round=rnd, ok=bool(top3))
+            if top3:
+                fresh[rnd] = top3
+        if fresh:
+            save_podiums(season, fresh, path)
+            known.update({str(rnd): top3 for rnd, top3 in fresh.items()})
+    return known, bool(missing)
@@ -1,25 +1,21 @@
 import streamlit as st
-import pandas as pd
-import requests
-from datetime import datetime
-import pytz
-import random
-import base64
 import os
-import fastf1 # Resmi veriler için kütüphane
-
-# --- FASTF1 AYARLARI ---
-if not os.path.exists('cache'):
-    os.makedirs('cache')
-fastf1.Cache.enable_cache('cache')
-
+import time
+import f1Ingest
+import f1Archive
+import f1Assets
+import f1Render
+import f1Registry
+import f1Live
+import f1Telemetry
+import f1Metrics
+
+@st.cache_resource(show_spinner=False)
 def get_local_img(file_path):
+    # Logo avatar boyutuna küçültülmüş ve süreç boyunca bellekte tutulur
     if not os.path.exists(file_path):
         return "https://media.formula1.com/d_driver_fallback_image.png"
-    with open(file_path, "rb") as f:
-        data = f.read()
-        encoded = base64.b64encode(data).decode()
-    return f"data:image/png;base64,{encoded}"
+    return f1Assets.logo_data_uri(file_path)
 
 # --- 1. SAYFA VE CSS AYARLARI ---
 st.set_page_config(page_title="F1 Standings", layout="centered", page_icon="🏎️")
@@ -82,288 +78,188 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 # --- 2. VERİ TANIMLARI ---
-TEAM_COLORS = {
-    "Red Bull": "#3671C6", "Mercedes": "#27F4D2", "Ferrari": "#E80020", "McLaren": "#FF8000", 
-    "Aston Martin": "#229971", "Alpine": "#0093CC", "Williams": "#64C4FF", "RB": "#6692FF", 
-    "Sauber": "#52E252", "Haas": "#B6BABD"
-}
-DRIVER_IMGS = {
-    "max_verstappen": "https://media.formula1.com/d_driver_fallback_image.png/content/dam/fom-website/drivers/M/MAXVER01_Max_Verstappen/maxver01.png",
-    "perez": "https://media.formula1.com/d_driver_fallback_image.png/content/dam/fom-website/drivers/S/SERPER01_Sergio_Perez/serper01.png",
-    "hamilton": "https://media.formula1.com/d_driver_fallback_image.png/content/dam/fom-website/drivers/L/LEWHAM01_Lewis_Hamilton/lewham01.png",
-    "russell": "https://media.formula1.com/d_driver_fallback_image.png/content/dam/fom-website/drivers/G/GEORUS01_George_Russell/georus01.png",
-    "leclerc": "https://media.formula1.com/d_driver_fallback_image.png/content/dam/fom-website/drivers/C/CHALEC01_Charles_Leclerc/chalec01.png",
-    "sainz": "https://media.formula1.com/d_driver_fallback_image.png/content/dam/fom-website/drivers/C/CARSAI01_Carlos_Sainz/carsai01.png",
-    "norris": "https://media.formula1.com/d_driver_fallback_image.png/content/dam/fom-website/drivers/L/LANNOR01_Lando_Norris/lannor01.png",
-    "piastri": "https://media.formula1.com/d_driver_fallback_image.png/content/dam/fom-website/drivers/O/OSCPIA01_Oscar_Piastri/oscpia01.png",
-    "alonso": "https://media.formula1.com/d_driver_fallback_image.png/content/dam/fom-website/drivers/F/FERALO01_Fernando_Alonso/feralo01.png",
-    "stroll": "https://media.formula1.com/d_driver_fallback_image.png/content/dam/fom-website/drivers/L/LANSTR01_Lance_Stroll/lanstr01.png",
-    "gasly": "https://media.formula1.com/d_driver_fallback_image.png/content/dam/fom-website/drivers/P/PIEGAS01_Pierre_Gasly/piegas01.png",
-    "ocon": "https://media.formula1.com/d_driver_fallback_image.png/content/dam/fom-website/drivers/E/ESTOCO01_Esteban_Ocon/estoco01.png",
-    "albon": "https://media.formula1.com/d_driver_fallback_image.png/content/dam/fom-website/drivers/A/ALEALB01_Alexander_Albon/alealb01.png",
-    "tsunoda": "https://media.formula1.com/d_driver_fallback_image.png/content/dam/fom-website/drivers/Y/YUKTSU01_Yuki_Tsunoda/yuktsu01.png",
-    "hulkenberg": "https://media.formula1.com/d_driver_fallback_image.png/content/dam/fom-website/drivers/N/NICHUL01_Nico_Hulkenberg/nichul01.png",
-    "bottas": "https://media.formula1.com/d_driver_fallback_image.png/content/dam/fom-website/drivers/V/VALBOT01_Valtteri_Bottas/valbot01.png",
-    "zhou": "https://media.formula1.com/d_driver_fallback_image.png/content/dam/fom-website/drivers/G/GUAZHO01_Guanyu_Zhou/guazho01.png",
-    "magnussen": "https://media.formula1.com/d_driver_fallback_image.png/content/dam/fom-website/drivers/K/KEVMAG01_Kevin_Magnussen/kevmag01.png",
-    "colapinto": "https://media.formula1.com/d_driver_fallback_image.png/content/dam/fom-website/drivers/F/FRACOL01_Franco_Colapinto/fracol01.png",
-    "bearman": "https://media.formula1.com/d_driver_fallback_image.png/content/dam/fom-website/drivers/O/OLIBEA01_Oliver_Bearman/olibea01.png",
-    "lawson": "https://media.formula1.com/d_driver_fallback_image.png/content/dam/fom-website/drivers/L/LIALAW01_Liam_Lawson/lialaw01.png"
-}
-TEAM_LOGOS = {
-    "McLaren": get_local_img("mclarenlogo.png"), "Red Bull": get_local_img("rblogo.png"),
-    "Ferrari": get_local_img("ferrari.png"), "Mercedes": get_local_img("merclogo.png"),
-    "Aston Martin": get_local_img("astonlogo.png"), "Alpine": get_local_img("alpinelogo.png"),
-    "Williams": get_local_img("williamslogo.png"), "RB": get_local_img("racingblogo.png"),
-    "Sauber": get_local_img("kicklogo.png"), "Haas": "https://upload.wikimedia.org/wikipedia/commons/thumb/d/d4/Logo_Haas_F1.png/100px-Logo_Haas_F1.png"
-}
-
-def get_img(driver_id):
-    for k, v in DRIVER_IMGS.items():
-        if k in driver_id.lower() or driver_id.lower() in k: return v
-    return "https://media.formula1.com/d_driver_fallback_image.png/content/dam/fom-website/drivers/driver_fallback_image.png"
-
-def get_team_color(team_name):
-    for k, v in TEAM_COLORS.items():
-        if k in team_name: return v
-    return "#333"
-
-def get_team_logo(team_name):
-    for k, v in TEAM_LOGOS.items():
-        if k in team_name: return v
-    return "https://upload.wikimedia.org/wikipedia/commons/thumb/5/53/F1_chequered_flag.svg/100px-F1_chequered_flag.svg.png"
-
-def format_session_time(date_str, time_str):
-    if not date_str or not time_str: return "TBC"
-    try:
-        dt_str = f"{date_str} {time_str}".replace("Z", "")
-        utc_dt = datetime.strptime(dt_str, '%Y-%m-%d %H:%M:%S').replace(tzinfo=pytz.utc)
-        tr_dt = utc_dt.astimezone(pytz.timezone('Europe/Istanbul'))
-        return tr_dt.strftime("%H:%M")
-    except:
-        return "TBC"
-
-def fetch_api(url):
-    try:
-        r = requests.get(url, timeout=5)
-        r.raise_for_status()
-        return r.json()
-    except: return None
-
-# --- VERİ ÇEKME: TOP 3 DESTEKLİ ---
-@st.cache_data(ttl=3600)
-def get_fastf1_winners():
-    """
-    FastF1'den sadece kazananı değil, İLK 3 PİLOTU çeker.
-    """
-    winners = {}
-    try:
-        current_year = datetime.now().year
-        schedule = fastf1.get_event_schedule(current_year)
-        completed_races = schedule[schedule['EventDate'] < datetime.now()]
-        
-        for i, row in completed_races.iterrows():
-            round_num = str(row['RoundNumber'])
-            event_name = row['EventName']
-            try:
-                session = fastf1.get_session(current_year, event_name, 'R')
-                session.load(laps=False, telemetry=False, weather=False, messages=False)
-                # İlk 3 pilotun kısaltmasını al
-                top3 = session.results.iloc[:3]['Abbreviation'].tolist()
-                winners[round_num] = top3
-            except:
-                continue 
-    except Exception as e:
-        print(f"FastF1 Hatası: {e}")
-    return winners
-
-@st.cache_data(ttl=600)
+@st.cache_resource(show_spinner=False)
+def get_registry():
+    # Renk, portre ve logolar süreç başına bir kez ID'lere göre dizinlenir
+    return f1Registry.Registry(logo_loader=get_local_img)
+
+registry = get_registry()
+
+@st.cache_resource(show_spinner=False)
+def start_refresher():
+    # Süreç başına bir kez; dosya kilidi sayesinde tüm süreçlerde tek yenileyici çalışır.
+    # f1Ingest.py ayrı bir süreç olarak çalışıyorsa F1_NO_REFRESHER=1 ile kapatılabilir.
+    if os.environ.get("F1_NO_REFRESHER") == "1": return None
+    return f1Ingest.start_background_refresher()
+
 def get_all_data():
-    OFFICIAL_WINNERS = get_fastf1_winners()
-    MANUAL_RESULTS = {}
-
-    # 1. PİLOTLAR
-    drivers = []
-    d_data = fetch_api("https://api.jolpi.ca/ergast/f1/current/driverStandings.json")
-    if d_data:
-        standings = d_data['MRData']['StandingsTable']['StandingsLists'][0]['DriverStandings']
-        for s in standings:
-            wins = int(s['wins'])
-            podiums = wins + random.randint(0, 5) if wins > 0 else random.randint(0, 3)
-            dnf = random.randint(0, 3)
-            drivers.append({
-                "pos": s['position'],
-                "name": f"{s['Driver']['givenName']} {s['Driver']['familyName'].upper()}",
-                "team": s['Constructors'][0]['name'],
-                "points": s['points'],
-                "wins": wins, "podiums": podiums, "dnf": dnf,
-                "id": s['Driver']['driverId']
-            })
-
-    # 2. MARKALAR
-    constructors = []
-    c_data = fetch_api("https://api.jolpi.ca/ergast/f1/current/constructorStandings.json")
-    if c_data:
-        c_standings = c_data['MRData']['StandingsTable']['StandingsLists'][0]['ConstructorStandings']
-        for c in c_standings:
-            constructors.append({
-                "pos": c['position'], "name": c['Constructor']['name'],
-                "points": c['points'], "wins": c['wins']
-            })
-
-    # 3. TAKVİM
-    calendar = []
-    cal_data = fetch_api("https://api.jolpi.ca/ergast/f1/current.json")
-    
-    # Ergast Results
-    ergast_winners = {}
-    res_data = fetch_api("https://api.jolpi.ca/ergast/f1/current/results.json?limit=500")
-    if res_data:
-        for r in res_data['MRData']['RaceTable']['Races']:
-            round_num = r['round']
+    # Sayfa her zaman son sağlam anlık görüntüden sunulur; ağ çağrısı yapılmaz.
+    # Hiç anlık görüntü yokken (ilk kurulum) yalnızca Ergast ile hızlı bir ilk boyama
+    # yapılır; FastF1 tamamlaması arka plandaki yenileyiciye kalır.
+    start_refresher()
+    snapshot = f1Ingest.read_snapshot()
+    if snapshot is None:
+        import f1Data
+        data = f1Data.get_all_data(use_fastf1=False)
+        # Bu arada yenileyici tam veriyi yazdıysa onun üzerine yazılmaz
+        if f1Ingest.is_good(data) and f1Ingest.read_snapshot() is None:
+            # Yenileyiciyle yarışı kaybetmek sorun değil; sayfa bu veriyle yine de çizilir
             try:
-                top3 = [res['Driver']['code'] for res in r['Results'][:3]]
-                ergast_winners[round_num] = top3
-            except: pass
-
-    quali_data = fetch_api("https://api.jolpi.ca/ergast/f1/current/qualifying.json?limit=500")
-    pole_sitters = {}
-    if quali_data:
-        for q in quali_data['MRData']['RaceTable']['Races']:
-            round_num = q['round']
-            try:
-                pole = q['QualifyingResults'][0]['Driver']['code']
-                pole_sitters[round_num] = pole
-            except: pass
-
-    if cal_data:
-        races = cal_data['MRData']['RaceTable']['Races']
-        now = datetime.now(pytz.utc)
-        
-        for r in races:
-            round_num = r['round']
-            race_name = r['raceName']
-            circuit = r['Circuit']['circuitName']
-            time_str = r.get('time', '12:00:00Z')
-            dt_str = f"{r['date']} {time_str}".replace("Z", "")
-            r_dt = datetime.strptime(dt_str, '%Y-%m-%d %H:%M:%S').replace(tzinfo=pytz.utc)
-            is_past = r_dt < now
-            days_diff = (r_dt - now).days
-            
-            # Top 3 Belirle
-            top3 = ergast_winners.get(round_num, None)
-            if (top3 is None) and str(round_num) in OFFICIAL_WINNERS:
-                top3 = OFFICIAL_WINNERS[str(round_num)]
-            if (top3 is None) and str(round_num) in MANUAL_RESULTS:
-                top3 = MANUAL_RESULTS[str(round_num)]
-            if top3 is None: top3 = []
-
-            pole = pole_sitters.get(round_num, "-")
-            
-            # Seanslar
-            sessions = []
-            if 'FirstPractice' in r: sessions.append({"name": "FP1", "time": format_session_time(r['FirstPractice'].get('date'), r['FirstPractice'].get('time')), "winner": ""})
-            if 'SprintQualifying' in r: sessions.append({"name": "Sprint Quali", "time": format_session_time(r['SprintQualifying'].get('date'), r['SprintQualifying'].get('time')), "winner": ""})
-            elif 'SecondPractice' in r: sessions.append({"name": "FP2", "time": format_session_time(r['SecondPractice'].get('date'), r['SecondPractice'].get('time')), "winner": ""})
-            if 'Sprint' in r: sessions.append({"name": "SPRINT", "time": format_session_time(r['Sprint'].get('date'), r['Sprint'].get('time')), "winner": ""})
-            elif 'ThirdPractice' in r: sessions.append({"name": "FP3", "time": format_session_time(r['ThirdPractice'].get('date'), r['ThirdPractice'].get('time')), "winner": ""})
-            if 'Qualifying' in r: sessions.append({"name": "QUALIFYING", "time": format_session_time(r['Qualifying'].get('date'), r['Qualifying'].get('time')), "winner": pole if is_past else ""})
-            sessions.append({"name": "RACE", "time": format_session_time(r.get('date'), r.get('time')), "winner": top3[0] if top3 else ""})
-
-            calendar.append({
-                "round": round_num,
-                "race": race_name,
-                "circuit": circuit,
-                "date_obj": r_dt,
-                "day": r_dt.day,
-                "month": r_dt.strftime("%b"),
-                "days_left": days_diff,
-                "is_past": is_past,
-                "top3": top3,
-                "sessions": sessions
-            })
-    return drivers, constructors, calendar
+                f1Ingest.write_snapshot(data, complete=False)
+            except OSError as e:
+                print(f"İlk anlık görüntü yazılamadı: {e}")
+        return data
+    return snapshot["data"]
 
 # --- 4. ARAYÜZ OLUŞTURMA ---
-drivers, constructors, calendar = get_all_data()
-
 st.title("Formula 1 Standings & Calender")
+
+# Arşivde sezon varsa seçici gösterilir; geçmiş sezon yalnızca seçildiğinde yüklenir
+CURRENT_SEASON = "Güncel"
+archived_seasons = f1Archive.available_seasons()
+season = st.selectbox("Sezon", [CURRENT_SEASON, *archived_seasons]) if archived_seasons else CURRENT_SEASON
 st.divider()
 
-tab_drivers, tab_constructors, tab_calendar = st.tabs(["DRIVERS", "CONSTRUCTOR", "SCHEDULE"])
-
-with tab_drivers:
-    if drivers:
-        for d in drivers:
-            color = get_team_color(d['team'])
-            img = get_img(d['id'])
-            st.markdown(f"""<details style="margin-bottom: 5px;"><summary class="card-row" style="border-left-color: {color};"><div class="pos-num">{d['pos']}</div><img src="{img}" class="avatar"><div class="info-box"><div class="main-name">{d['name']}</div><div class="sub-name">{d['team']}</div></div><div class="points-box"><div class="pts-val">{d['points']}</div><div class="pts-lbl">PTS</div></div></summary><div class="details-panel"><div class="stats-row"><div class="stat-box"><div class="stat-val" style="color:#ffd700;">{d['wins']}</div><div class="stat-lbl">Galibiyet</div></div><div class="stat-box"><div class="stat-val" style="color:#c0c0c0;">{d['podiums']}</div><div class="stat-lbl">Podyum</div></div><div class="stat-box"><div class="stat-val" style="color:#ff4d4d;">{d['dnf']}</div><div class="stat-lbl">DNF</div></div></div></div></details>""", unsafe_allow_html=True)
-    else: st.info("Veri yükleniyor...")
-
-with tab_constructors:
-    if constructors:
-        for c in constructors:
-            color = get_team_color(c['name'])
-            logo = get_team_logo(c['name'])
-            st.markdown(f"""<div class="card-row" style="border-left-color: {color}; cursor: default;"><div class="pos-num">{c['pos']}</div><img src="{logo}" class="avatar" style="border-radius: 5px; width: 60px; object-fit: contain; background: transparent; border: none;"><div class="info-box"><div class="main-name">{c['name']}</div><div class="sub-name">{c['wins']} Galibiyet</div></div><div class="points-box"><div class="pts-val">{c['points']}</div><div class="pts-lbl">PTS</div></div></div>""", unsafe_allow_html=True)
-
-# --- SEKME 3: TAKVİM (DÜZELTİLMİŞ) ---
-with tab_calendar:
-    if calendar:
-        next_race_idx = -1
-        for i, r in enumerate(calendar):
-            if not r['is_past']:
-                next_race_idx = i
-                break
-        
-        for idx, race in enumerate(calendar):
-            is_next = (idx == next_race_idx)
-            border_color = "#FF1801" if is_next else "#333"
-            
-            # ROZET ALANI (DÜZELTME: Girintiler kaldırıldı ve tek satır yapıldı)
-            if race['is_past']:
-                if race['top3'] and len(race['top3']) >= 3:
-                    badge_html = (
-                        f'<div class="badge-val p1">1. {race["top3"][0]}</div>'
-                        f'<div class="badge-val p2">2. {race["top3"][1]}</div>'
-                        f'<div class="badge-val p3">3. {race["top3"][2]}</div>'
-                    )
-                elif race['top3'] and len(race['top3']) > 0:
-                    badge_html = f'<div class="badge-val p1">1. {race["top3"][0]}</div>'
-                else:
-                    badge_html = '<div class="badge-lbl">SONUÇ BEKLENİYOR</div>'
-            elif is_next:
-                days = race['days_left'] if race['days_left'] >= 0 else 0
-                badge_html = f'<div class="badge-val" style="color:#FF1801;">{days}</div><div class="badge-lbl">GÜN KALDI</div>'
-            else:
-                badge_html = f'<div class="badge-val">{race["days_left"]}</div><div class="badge-lbl">GÜN</div>'
-
-            sessions_html = ""
-            for sess in race['sessions']:
-                winner_div = f'<div class="sess-result">{sess["winner"]}</div>' if sess["winner"] else '<div class="sess-result"></div>'
-                sessions_html += f'<div class="session-row"><div class="sess-name">{sess["name"]}</div><div class="sess-time">{sess["time"]}</div>{winner_div}</div>'
-
-            # Ana Kart HTML (Girintiler kaldırıldı)
-            html_content = f"""
-            <details name="f1-race" style="margin-bottom: 8px;">
-                <summary class="calendar-card" style="display: flex; align-items: center; background-color: #121214; border-radius: 8px; padding: 15px; border-left: 5px solid {border_color}; cursor: pointer;">
-                    <div class="cal-date">
-                        <div class="cal-day">{race['day']}</div>
-                        <div class="cal-month">{race['month']}</div>
-                    </div>
-                    <div class="cal-info" style="flex-grow: 1;">
-                        <div class="cal-race">{race['race']}</div>
-                        <div class="cal-circuit">{race['circuit']}</div>
-                    </div>
-                    <div class="cal-badge">
-                        {badge_html}
-                    </div>
-                </summary>
-                <div class="details-panel">
-                    {sessions_html}
-                </div>
-            </details>
-            """
-            st.markdown(html_content, unsafe_allow_html=True)
+if season == CURRENT_SEASON:
+    drivers, constructors, calendar = get_all_data()
+    view_season = None
+else:
+    drivers, constructors, calendar = f1Archive.season_view(season)
+    view_season = season
+
+def get_team_color(team): return registry.color_of(team, view_season)
+def get_team_logo(team): return registry.logo_of(team, view_season)
+def get_img(driver_id): return registry.portrait_of(driver_id, view_season)
+
+def build_html(name, data, cards=None):
+    drivers, constructors, calendar = data
+    if name == "drivers": return f1Render.render_drivers(drivers, get_team_color, get_img)
+    if name == "constructors": return f1Render.render_constructors(constructors, get_team_color, get_team_logo)
+    # Canlı modda takvim kartları tek tek önbelleklenir
+    if cards is not None: return f1Render.render_calendar_cached(calendar, cards)
+    return f1Render.render_calendar(calendar)
+
+def draw_tab(name, data, html):
+    # Her sekme tek geçişte oluşturulup tek öğe olarak gönderilir
+    drivers, constructors, calendar = data
+    if name == "drivers":
+        if drivers: st.markdown(html, unsafe_allow_html=True)
+        else: st.info("Veri yükleniyor...")
+    elif name == "constructors":
+        if constructors: st.markdown(html, unsafe_allow_html=True)
+    elif calendar:
+        st.markdown(html, unsafe_allow_html=True)
     else:
         st.success("Takvim yükleniyor...")
+
+# --- CANLI MOD ---
+@st.cache_resource(show_spinner=False)
+def get_live_feed():
+    return f1Live.make_feed()
+
+@st.cache_data(ttl=f1Live.SESSION_POLL_INTERVAL, show_spinner=False)
+def poll_live_feed():
+    # Tüm izleyiciler ve sekmeler aynı yoklamayı paylaşır
+    return get_live_feed()()
+
+def live_tab(name):
+    """
+    Sekme başına bir parça (fragment) olarak kısa aralıklarla yeniden çalışır. Yeni veri
+    öncekiyle karşılaştırılır; sekme değişmediyse oturumda saklanan HTML gönderilir,
+    takvimde ise yalnızca değişen yarış kartları yeniden oluşturulur.
+    """
+    data = poll_live_feed() or (drivers, constructors, calendar)
+    state = st.session_state.setdefault(f"live_{name}", {"data": None, "html": None, "cards": {}})
+    changes = f1Live.diff_data(state["data"], data)
+    if state["html"] is None or changes[name]:
+        state["html"] = build_html(name, data, state["cards"])
+    state["data"] = data
+    draw_tab(name, data, state["html"])
+    # Haftasonu bittiyse normal moda dönmek, seans başlayıp bittiyse parçayı yeni yoklama
+    # aralığıyla kurmak için tüm sayfa yeniden çalıştırılır (run_every yalnızca orada belirlenir)
+    if name == "calendar" and (not f1Live.is_live(data[2]) or f1Live.poll_interval(data[2]) != live_interval): st.rerun()
+
+# --- SEKME 4: ANALİZ ---
+def analysis_panel():
+    """Kendi parçasında çalışır; seçim değiştikçe yalnızca bu sekme yeniden çizilir."""
+    # pandas/altair ve seans verisi yalnızca analiz açıldığında yüklenir (ilk boyamayı yavaşlatmaz)
+    if not st.toggle("Analizi göster"): return
+    import pandas as pd
+    import altair as alt
+    past_races = [r for r in calendar if r['is_past']]
+    if not past_races:
+        st.info("Henüz tamamlanmış yarış yok")
+        return
+    race = st.selectbox("Yarış", past_races[::-1], format_func=lambda r: f"{r['round']}. {r['race']}")
+    identifier = st.radio("Seans", ["R", "Q"], horizontal=True, format_func={"R": "Yarış", "Q": "Sıralama"}.get)
+    year = int(view_season) if view_season else race['date_obj'].year
+
+    if not f1Telemetry.is_stored(year, race['round'], identifier):
+        if not st.button("Tur ve telemetri verisini yükle"): return
+        with st.spinner("FastF1 seansı yükleniyor..."):
+            try:
+                f1Telemetry.store_session(year, race['round'], identifier)
+            except Exception as e:
+                st.error(f"Seans yüklenemedi: {e}")
+                return
+
+    laps = f1Telemetry.lap_time_distribution(year, race['round'], identifier)
+    st.subheader("Tur süreleri")
+    st.altair_chart(alt.Chart(laps).mark_boxplot(extent="min-max").encode(
+        x=alt.X("driver:N", title=None, sort="y"), y=alt.Y("time:Q", title="sn", scale=alt.Scale(zero=False)),
+        color=alt.Color("driver:N", legend=None)
+    ), use_container_width=True)
+
+    st.subheader("Stint ve lastikler")
+    st.dataframe(f1Telemetry.stint_summary(year, race['round'], identifier), hide_index=True, use_container_width=True)
+
+    st.subheader("Hız izi (en hızlı tur)")
+    meta, _ = f1Telemetry.open_session(year, race['round'], identifier)
+    pilots = st.multiselect("Pilotlar", meta["drivers"], default=meta["drivers"][:2], max_selections=4)
+    traces = []
+    for pilot in pilots:
+        trace = f1Telemetry.speed_trace(year, race['round'], identifier, pilot)
+        if trace is not None:
+            traces.append(pd.DataFrame({"distance": trace[0], "speed": trace[1], "driver": pilot}))
+    if traces:
+        st.altair_chart(alt.Chart(pd.concat(traces)).mark_line().encode(
+            x=alt.X("distance:Q", title="Mesafe (m)"), y=alt.Y("speed:Q", title="km/s", scale=alt.Scale(zero=False)),
+            color="driver:N"
+        ), use_container_width=True)
+
+# --- HATA AYIKLAMA PANELİ ---
+# ?debug=1 ya da F1_DEBUG=1 ile açılır: istek süreleri, önbellek isabetleri, FastF1 yüklemeleri
+def debug_panel():
+    import json
+    with st.sidebar:
+        st.header("Debug")
+        snapshot = f1Ingest.read_snapshot()
+        if snapshot:
+            st.caption(f"Anlık görüntü v{snapshot['version']}, {time.time() - snapshot['created']:.0f} sn önce"
+                       + ("" if snapshot.get("complete", True) else " (FastF1 bekleniyor)"))
+        st.dataframe(f1Metrics.summary(), hide_index=True)
+        if registry.unmatched:
+            st.caption("Eşleşmeyen: " + ", ".join(f"{kind}:{key}" for kind, key in sorted(registry.unmatched)))
+        st.download_button("JSON günlüğü", json.dumps(f1Metrics.events(), default=str), file_name="f1_metrics.json")
+
+if st.query_params.get("debug") == "1" or os.environ.get("F1_DEBUG") == "1":
+    debug_panel()
+
+TAB_NAMES = ("drivers", "constructors", "calendar")
+data = (drivers, constructors, calendar)
+live = season == CURRENT_SEASON and f1Live.is_live(calendar)
+if live: st.caption("🔴 CANLI: veriler otomatik güncelleniyor")
+tabs = st.tabs(["DRIVERS", "CONSTRUCTOR", "SCHEDULE", "ANALYSIS"])
+
+if live:
+    # Aralık parçanın kullandığı akışın takviminden hesaplanır ki live_tab aynı değeri bulsun
+    live_interval = f1Live.poll_interval((poll_live_feed() or data)[2])
+    live_fragment = st.fragment(live_tab, run_every=live_interval)
+    for name, tab in zip(TAB_NAMES, tabs):
+        with tab: live_fragment(name)
+else:
+    for name, tab in zip(TAB_NAMES, tabs):
+        with tab: draw_tab(name, data, build_html(name, data))
+
+with tabs[3]:
+    st.fragment(analysis_panel)()
@@ -0,0 +1,163 @@
+import os
+import json
+import shutil
+import tempfile
+import threading
+from functools import lru_cache
+import f1Cache
+import f1Metrics
+
+# --- TUR VE TELEMETRİ ANALİZİ ---
+# Bir seansın tur tablosu ve her pilotun en hızlı turunun hız izi bir kez FastF1'den
+# alınıp telemetry/<sezon>/<tur>_<seans>/ altına float32/int16 .npy dosyaları olarak
+# yazılır. Okuma bellek eşlemelidir (mmap); süreç başına en fazla SESSION_CACHE_SIZE
+# seans açık tutulur ve izler çizim için LTTB ile seyreltilir.
+TELEMETRY_DIR = os.environ.get("F1_TELEMETRY_DIR", "telemetry")
+SESSION_CACHE_SIZE = 4
+TRACE_POINTS = 400
+LAP_ARRAYS = ("lap_driver", "lap_number", "lap_time", "lap_stint", "lap_compound", "lap_tyre_life")
+TRACE_ARRAYS = ("trace_distance", "trace_speed")
+
+def session_dir(season, round_num, identifier="R", base_dir=TELEMETRY_DIR):
+    return os.path.join(base_dir, str(int(season)), f"{int(round_num):02d}_{identifier}")
+
+def is_stored(season, round_num, identifier="R", base_dir=TELEMETRY_DIR):
+    return os.path.exists(os.path.join(session_dir(season, round_num, identifier, base_dir), "meta.json"))
+
+# Aynı seansı aynı anda isteyen izleyiciler tek bir session.load() bekler; kilitler
+# (sezon, tur, seans) başına tutulur. Farklı seansların yüklemeleri de süreç başına
+# MAX_CONCURRENT_LOADS ile sınırlanır; her biri tam tur ve telemetri verisini belleğe alır.
+MAX_CONCURRENT_LOADS = int(os.environ.get("F1_TELEMETRY_LOADS", "1"))
+_load_slots = threading.BoundedSemaphore(MAX_CONCURRENT_LOADS)
+_load_locks = {}
+_load_locks_guard = threading.Lock()
+
+def session_lock(season, round_num, identifier):
+    with _load_locks_guard:
+        return _load_locks.setdefault((int(season), int(round_num), identifier), threading.Lock())
+
+def store_session(season, round_num, identifier="R", base_dir=TELEMETRY_DIR):
+    """Seansı FastF1'den bir kez yükler ve tipli dizilere dönüştürüp diske yazar."""
+    with session_lock(season, round_num, identifier):
+        if is_stored(season, round_num, identifier, base_dir):
+            return session_dir(season, round_num, identifier, base_dir)
+        with _load_slots:
+            return build_session(season, round_num, identifier, base_dir)
+
+def build_session(season, round_num, identifier, base_dir):
+    import numpy as np
+    import f1Data
+    fastf1 = f1Data.get_fastf1()
+    session = fastf1.get_session(int(season), int(round_num), identifier)
+    with f1Metrics.timed("fastf1", "telemetry.load", round=int(round_num), session=identifier):
+        session.load(laps=True, telemetry=True, weather=False, messages=False)
+    f1Cache.touch_session(session)
+    f1Cache.enforce_limit()  # En büyük önbellek tüketicisi; boyut sınırı burada da uygulanır
+    laps = session.laps
+
+    drivers = sorted(laps['Driver'].dropna().unique().tolist())
+    compounds = sorted(laps['Compound'].dropna().unique().tolist())
+    driver_idx = {d: i for i, d in enumerate(drivers)}
+    compound_idx = {c: i for i, c in enumerate(compounds)}
+    arrays = {
+        "lap_driver": laps['Driver'].map(driver_idx).fillna(-1).to_numpy(np.int16),
+        "lap_number": laps['LapNumber'].fillna(0).to_numpy(np.int16),
+        "lap_time": laps['LapTime'].dt.total_seconds().to_numpy(np.float32),
+        "lap_stint": laps['Stint'].fillna(0).to_numpy(np.int16),
+        "lap_compound": laps['Compound'].map(compound_idx).fillna(-1).to_numpy(np.int16),
+        "lap_tyre_life": laps['TyreLife'].to_numpy(np.float32)
+    }
+
+    # Her pilotun en hızlı turunun hız izi uç uca eklenir; sınırlar meta'da tutulur
+    distances, speeds, offsets, start = [], [], {}, 0
+    for driver in drivers:
+        try:
+            lap = laps.pick_drivers(driver).pick_fastest()
+            car = lap.get_car_data().add_distance()
+        except Exception:
+            continue
+        distances.append(car['Distance'].to_numpy(np.float32))
+        speeds.append(car['Speed'].to_numpy(np.float32))
+        offsets[driver] = [start, start + len(car)]
+        start += len(car)
+    arrays["trace_distance"] = np.concatenate(distances) if distances else np.zeros(0, np.float32)
+    arrays["trace_speed"] = np.concatenate(speeds) if speeds else np.zeros(0, np.float32)
+
+    final_dir = session_dir(season, round_num, identifier, base_dir)
+    os.makedirs(os.path.dirname(final_dir), exist_ok=True)
+    tmp_dir = tempfile.mkdtemp(prefix=f"{os.path.basename(final_dir)}.", suffix=".tmp", dir=os.path.dirname(final_dir))
+    for name, array in arrays.items():
+        np.save(os.path.join(tmp_dir, f"{name}.npy"), array)
+    meta = {"season": int(season), "round": int(round_num), "identifier": identifier, "event": session.event['EventName'],
+            "drivers": drivers, "compounds": compounds, "trace_offsets": offsets}
+    with open(os.path.join(tmp_dir, "meta.json"), "w", encoding="utf-8") as f:
+        json.dump(meta, f)
+    try:
+        os.replace(tmp_dir, final_dir)
+    except OSError:
+        # Aynı seansı başka bir süreç bu arada yazmış
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+    return final_dir
+
+@lru_cache(maxsize=SESSION_CACHE_SIZE)
+def open_session(season, round_num, identifier="R", base_dir=TELEMETRY_DIR):
+    import numpy as np
+    path = session_dir(season, round_num, identifier, base_dir)
+    with open(os.path.join(path, "meta.json"), encoding="utf-8") as f:
+        meta = json.load(f)
+    arrays = {name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode="r") for name in LAP_ARRAYS + TRACE_ARRAYS}
+    return meta, arrays
+
+def lttb(x, y, threshold):
+    """
+    Largest-Triangle-Three-Buckets: eğrinin şeklini koruyarak noktayı threshold'a indirir.
+    İlk ve son nokta korunur; her kovadan bir önceki seçilen nokta ve bir sonraki kovanın
+    ortalamasıyla en büyük üçgeni kuran nokta seçilir.
+    """
+    import numpy as np
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.asarray(x), np.asarray(y)
+    edges = np.linspace(1, n - 1, threshold - 1).astype(int)
+    out = np.empty(threshold, dtype=int)
+    out[0], out[-1] = 0, n - 1
+    a = 0
+    for i in range(threshold - 2):
+        lo, hi = edges[i], edges[i + 1]
+        nlo, nhi = edges[i + 1], (edges[i + 2] if i + 2 < len(edges) else n)
+        avg_x, avg_y = x[nlo:nhi].mean(), y[nlo:nhi].mean()
+        area = np.abs((x[a] - avg_x) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (avg_y - y[a]))
+        a = lo + int(area.argmax())
+        out[i + 1] = a
+    return np.asarray(x)[out], np.asarray(y)[out]
+
+@lru_cache(maxsize=64)
+def speed_trace(season, round_num, identifier, driver, points=TRACE_POINTS):
+    # Seyreltilmiş iz küçüktür; tüm izleyiciler aynı kopyayı paylaşır
+    meta, arrays = open_session(season, round_num, identifier)
+    if driver not in meta["trace_offsets"]: return None
+    start, end = meta["trace_offsets"][driver]
+    distance, speed = lttb(arrays["trace_distance"][start:end], arrays["trace_speed"][start:end], points)
+    return distance.astype("float32"), speed.astype("float32")
+
+def laps_frame(season, round_num, identifier="R"):
+    import pandas as pd
+    meta, arrays = open_session(season, round_num, identifier)
+    frame = pd.DataFrame({name.replace("lap_", ""): arrays[name] for name in LAP_ARRAYS})
+    frame = frame[frame['driver'] >= 0]
+    frame['driver'] = pd.Categorical.from_codes(frame['driver'], meta["drivers"])
+    frame['compound'] = [meta["compounds"][c] if c >= 0 else "?" for c in frame['compound']]
+    return frame
+
+def lap_time_distribution(season, round_num, identifier="R", cutoff=1.07):
+    # Pit ve güvenlik aracı turları dağılımı bozmasın diye medyanın %107'si üstü atılır
+    frame = laps_frame(season, round_num, identifier).dropna(subset=["time"])
+    return frame[frame['time'] <= frame['time'].median() * cutoff][["driver", "number", "time", "compound"]]
+
+def stint_summary(season, round_num, identifier="R"):
+    frame = laps_frame(season, round_num, identifier)
+    summary = frame.groupby(["driver", "stint"], observed=True).agg(
+        compound=("compound", "first"), laps=("number", "count"),
+        avg_time=("time", "mean"), best_time=("time", "min"), tyre_life=("tyre_life", "max")
+    ).reset_index()
+    return summary[summary['stint'] > 0].round({"avg_time": 3, "best_time": 3})
@@ -0,0 +1,64 @@
+import os
+import sys
+import json
+import time
+import threading
+import unittest
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import f1Data
+
+# Uç nokta başına farklı gecikme: paralel çekimde toplam süre en yavaşı izlemeli
+DELAYS = {"/drivers.json": 0.3, "/constructors.json": 0.6, "/calendar.json": 0.9}
+
+class StubHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        time.sleep(DELAYS.get(self.path, 0))
+        body = json.dumps({"MRData": {"path": self.path}}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+class FetchManyTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.api_base = f1Data.API_BASE
+        f1Data.API_BASE = f"http://127.0.0.1:{cls.server.server_address[1]}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        f1Data.API_BASE = cls.api_base
+
+    def urls(self):
+        return {path[1:-len(".json")]: f"{f1Data.API_BASE}{path}" for path in DELAYS}
+
+    def test_cold_load_tracks_slowest_endpoint(self):
+        f1Data.fetch_many({"warmup": f"{f1Data.API_BASE}/warmup.json"})
+        t0 = time.perf_counter()
+        results = f1Data.fetch_many(self.urls())
+        elapsed = time.perf_counter() - t0
+
+        self.assertEqual({name: r["MRData"]["path"] for name, r in results.items()},
+                         {path[1:-len(".json")]: path for path in DELAYS})
+        self.assertGreaterEqual(elapsed, max(DELAYS.values()))
+        self.assertLess(elapsed, max(DELAYS.values()) + 0.3)
+        self.assertLess(elapsed, sum(DELAYS.values()))
+
+    def test_slow_endpoint_returns_partial_result(self):
+        results = f1Data.fetch_many(self.urls(), deadline=0.6 + 0.15)
+        self.assertIsNotNone(results["drivers"])
+        self.assertIsNotNone(results["constructors"])
+        self.assertIsNone(results["calendar"])
+
+if __name__ == "__main__":
+    unittest.main()